@@ -10,7 +10,12 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_asgi_application()
+
+# Warm the URL resolver cache at import: accessing reverse_dict loads the
+# URLconf and builds the reverse lookup tables before the first request.
+_ = get_resolver().reverse_dict
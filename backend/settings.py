@@ -101,8 +101,13 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database - Production-ready mit PostgreSQL
 if os.environ.get('DATABASE_URL'):
     # Production: PostgreSQL auf Render.com
+    # Persistent connections (reused across requests, checked before reuse)
     DATABASES = {
-        'default': dj_database_url.parse(os.environ.get('DATABASE_URL'))
+        'default': dj_database_url.parse(
+            os.environ.get('DATABASE_URL'),
+            conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', '300')),
+            conn_health_checks=True,
+        )
     }
 else:
     # Development: SQLite
@@ -129,6 +134,17 @@ if os.environ.get('REDIS_URL'):
                 'PARSER_CLASS': 'redis.connection.HiredisParser',
                 'PICKLE_VERSION': -1,
             }
+        },
+        # JWT-Blacklist: eigener Store, Redis dort mit maxmemory-policy noeviction
+        # (Verdrängung würde gesperrte Refresh-Tokens wieder gültig machen)
+        'jwt_blacklist': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': os.environ.get('JWT_BLACKLIST_REDIS_URL') or os.environ.get('REDIS_URL'),
+            'KEY_PREFIX': 'jwt_blacklist',
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                'PARSER_CLASS': 'redis.connection.HiredisParser',
+            }
         }
     }
     # Session Backend für Production (optional - OAuth nutzt jetzt Cache direkt)
@@ -140,9 +156,23 @@ else:
         'default': {
             'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
             'LOCATION': 'oauth-state-cache',
+        },
+        'jwt_blacklist': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'jwt-blacklist',
+            # Keine Verdrängung gesperrter Tokens durch das LocMem-Limit
+            'OPTIONS': {'MAX_ENTRIES': 10 ** 9},
         }
     }
 
+# JWT-Blacklist im Cache statt in der Database (default: nur mit eigenem, nicht
+# verdrängendem Redis unter JWT_BLACKLIST_REDIS_URL, da LocMem pro Prozess ist)
+JWT_BLACKLIST_USE_CACHE = os.environ.get(
+    'JWT_BLACKLIST_USE_CACHE', 'True' if os.environ.get('JWT_BLACKLIST_REDIS_URL') else 'False'
+).lower() == 'true'
+# Database-Blacklist zusätzlich prüfen (mindestens eine Refresh-Lifetime nach der Umstellung)
+JWT_BLACKLIST_CHECK_DB = os.environ.get('JWT_BLACKLIST_CHECK_DB', 'True').lower() == 'true'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -151,6 +181,11 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Authentication backends (the default backend, joining the user profile)
+AUTHENTICATION_BACKENDS = [
+    'elearning.users.authentication.ProfileModelBackend',
+]
+
 # Internationalization
 LANGUAGE_CODE = 'de-de'
 TIME_ZONE = 'Europe/Berlin'
@@ -179,7 +214,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'elearning.users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.AllowAny',
@@ -18,6 +18,7 @@ Version: 1.0.0
 
 from django.contrib import admin
 from django.utils import timezone
+from datetime import timedelta
 from django.utils.html import format_html
 from .models import OAuthState
 
@@ -75,9 +76,26 @@ class OAuthStateAdmin(admin.ModelAdmin):
         return "-"
     user_identifier_preview.short_description = "User ID"
     
+    def get_changelist_instance(self, request):
+        """
+        Changelist mit einer Referenzzeit für alle Zeilen der Seite
+        
+        timezone.now() wird einmal pro Seite ermittelt und an die Objekte
+        gehängt, statt in jeder Spalte jeder Zeile neu berechnet zu werden.
+        """
+        changelist = super().get_changelist_instance(request)
+        now = timezone.now()
+        for obj in changelist.result_list:
+            obj._admin_now = now
+        return changelist
+    
+    def _reference_now(self, obj):
+        """Referenzzeit der Changelist, sonst aktuelle Zeit (z.B. Detailansicht)"""
+        return getattr(obj, '_admin_now', None) or timezone.now()
+    
     def status_indicator(self, obj):
         """Visual indicator für State Status"""
-        if obj.is_expired():
+        if self._reference_now(obj) > obj.expires_at:
             return format_html(
                 '<span style="color: #dc3545;">🔴 Abgelaufen</span>'
             )
@@ -89,11 +107,10 @@ class OAuthStateAdmin(admin.ModelAdmin):
     
     def time_remaining(self, obj):
         """Verbleibende Zeit bis Ablauf"""
-        if obj.is_expired():
-            time_expired = timezone.now() - obj.expires_at
-            return f"Abgelaufen vor {time_expired}"
+        time_left = obj.expires_at - self._reference_now(obj)
+        if time_left < timedelta(0):
+            return f"Abgelaufen vor {-time_left}"
         else:
-            time_left = obj.time_until_expiry()
             return f"Läuft ab in {time_left}"
     time_remaining.short_description = "Zeit verbleibend"
     
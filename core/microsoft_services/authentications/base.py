@@ -9,7 +9,7 @@ employees, customers, or other user types.
 Key Responsibilities:
 - Building OAuth authorization URLs.
 - Exchanging authorization codes for access tokens.
-- Retrieving user profiles from Microsoft Graph.
+- Retrieving user profiles from the id_token or Microsoft Graph.
 - Centralized error handling for Microsoft APIs.
 
 Author: DSP Development Team
@@ -17,12 +17,16 @@ Version: 2.0.0 (Refactored)
 """
 
 import logging
+import jwt
 import requests
+from jwt import PyJWKClient
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote, urlencode
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from core.microsoft_services.core_integrations.http_session import microsoft_http_session
 from core.microsoft_services.core_integrations.exceptions import (
     AzureAuthException,
     MicrosoftGraphException,
@@ -39,7 +43,18 @@ class MicrosoftAuthClient:
     OAUTH_SCOPE = "openid email profile User.Read"
     TOKEN_URL_TEMPLATE = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
     AUTH_URL_TEMPLATE = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/authorize"
+    OPENID_CONFIG_URL_TEMPLATE = (
+        "https://login.microsoftonline.com/{tenant_id}/v2.0/.well-known/openid-configuration"
+    )
+    # Signing keys rotate rarely; the key set is refetched at most hourly
+    JWKS_CACHE_LIFESPAN = 3600
+    # Key set fetch (urllib, outside the pooled session); on timeout the
+    # login falls back to Graph /me
+    JWKS_FETCH_TIMEOUT = 3
     GRAPH_USER_URL = "https://graph.microsoft.com/v1.0/me"
+    GRAPH_USER_FIELDS = "id,displayName,mail,userPrincipalName,givenName,surname"
+    # (connect, read): unreachable hosts fail fast, slow responses keep 30s
+    REQUEST_TIMEOUT = (3, 30)
 
     def __init__(self):
         self.client_id = settings.AZURE_CLIENT_ID
@@ -49,25 +64,34 @@ class MicrosoftAuthClient:
             raise ImproperlyConfigured(
                 "Azure AD settings (CLIENT_ID, CLIENT_SECRET, TENANT_ID) must be configured."
             )
-
-    def build_authorization_url(self, request, state: str, redirect_uri: str) -> str:
-        """Builds the full authorization URL to redirect the user to Microsoft."""
-        params = {
+        # Tenant URL and request-independent query parameters, encoded once
+        static_params = urlencode({
             "client_id": self.client_id,
             "response_type": "code",
-            "redirect_uri": redirect_uri,
             "scope": self.OAUTH_SCOPE,
-            "state": state,
             "response_mode": "query",
-        }
+        })
         auth_url = self.AUTH_URL_TEMPLATE.format(tenant_id=self.tenant_id)
-        return f"{auth_url}?{urlencode(params)}"
+        self._authorization_url_prefix = f"{auth_url}?{static_params}"
+        self._token_url = self.TOKEN_URL_TEMPLATE.format(tenant_id=self.tenant_id)
+        # Issuer and key set URL are discovered on first use, so AZURE_TENANT_ID
+        # may hold the tenant GUID or a verified domain
+        self._openid_config_url = self.OPENID_CONFIG_URL_TEMPLATE.format(tenant_id=self.tenant_id)
+        self._openid_config: Optional[Dict[str, Any]] = None
+        self._jwks_client: Optional[PyJWKClient] = None
+
+    def build_authorization_url(self, request, state: str, redirect_uri: str) -> str:
+        """Builds the full authorization URL to redirect the user to Microsoft."""
+        return (
+            f"{self._authorization_url_prefix}"
+            f"&redirect_uri={quote(redirect_uri, safe='')}&state={quote(state, safe='')}"
+        )
 
     def exchange_code_for_token(
         self, auth_code: str, redirect_uri: str
     ) -> Dict[str, Any]:
         """Exchanges an authorization code for an access token."""
-        token_url = self.TOKEN_URL_TEMPLATE.format(tenant_id=self.tenant_id)
+        token_url = self._token_url
         token_data = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
@@ -82,7 +106,9 @@ class MicrosoftAuthClient:
 
         try:
             logger.debug("Exchanging authorization code for access token.")
-            response = requests.post(token_url, data=token_data, headers=headers, timeout=30)
+            response = microsoft_http_session.post(
+                token_url, data=token_data, headers=headers, timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
 
             token_response = response.json()
@@ -107,20 +133,87 @@ class MicrosoftAuthClient:
                 f"Token exchange request failed: {e}", auth_step="request_error"
             ) from e
 
+    def get_user_info_from_token_response(self, token_response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the user profile for a token response, preferring the id_token.
+
+        The id_token is only used after full validation against the tenant's
+        signing keys (signature, expiry, audience and issuer). If it is
+        missing, invalid or carries no usable address, Microsoft Graph is
+        queried via /me instead.
+        """
+        user_info = self._user_info_from_id_token(token_response.get("id_token"))
+        if user_info is not None:
+            logger.debug("Using id_token claims as user info.")
+            return user_info
+        return self.get_user_info(token_response["access_token"])
+
+    def _user_info_from_id_token(self, id_token: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Maps validated id_token claims to the Graph /me fields, or None if unusable."""
+        if not id_token:
+            return None
+        try:
+            openid_config = self._get_openid_configuration()
+            signing_key = self._get_jwks_client(openid_config).get_signing_key_from_jwt(id_token)
+            claims = jwt.decode(
+                id_token,
+                signing_key.key,
+                algorithms=["RS256"],
+                audience=self.client_id,
+                issuer=openid_config["issuer"],
+                options={"require": ["exp", "iat", "aud", "iss"]},
+            )
+        except (jwt.PyJWTError, requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logger.warning(f"Could not validate id_token, falling back to Graph: {e}")
+            return None
+
+        if not (claims.get("email") or claims.get("preferred_username")):
+            return None
+
+        return {
+            "id": claims.get("oid"),
+            "displayName": claims.get("name"),
+            "mail": claims.get("email"),
+            "userPrincipalName": claims.get("preferred_username"),
+            "givenName": claims.get("given_name"),
+            "surname": claims.get("family_name"),
+        }
+
+    def _get_openid_configuration(self) -> Dict[str, Any]:
+        """Returns the tenant's OpenID configuration, fetched once per process."""
+        if self._openid_config is None:
+            response = microsoft_http_session.get(
+                self._openid_config_url, timeout=self.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            self._openid_config = response.json()
+        return self._openid_config
+
+    def _get_jwks_client(self, openid_config: Dict[str, Any]) -> PyJWKClient:
+        """Returns the caching key set client for the discovered jwks_uri."""
+        if self._jwks_client is None:
+            self._jwks_client = PyJWKClient(
+                openid_config["jwks_uri"],
+                cache_keys=True,
+                lifespan=self.JWKS_CACHE_LIFESPAN,
+                timeout=self.JWKS_FETCH_TIMEOUT,
+            )
+        return self._jwks_client
+
     def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Retrieves user information from the Microsoft Graph API."""
+        # GET without a body: no Content-Type header
         headers = {
             "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
+            "Accept": "application/json",
         }
-        user_fields = "id,displayName,mail,userPrincipalName,givenName,surname"
 
         try:
             logger.debug("Retrieving user info from Microsoft Graph.")
-            response = requests.get(
-                f"{self.GRAPH_USER_URL}?$select={user_fields}",
+            response = microsoft_http_session.get(
+                f"{self.GRAPH_USER_URL}?$select={self.GRAPH_USER_FIELDS}",
                 headers=headers,
-                timeout=30,
+                timeout=self.REQUEST_TIMEOUT,
             )
             response.raise_for_status()
             
@@ -139,3 +232,14 @@ class MicrosoftAuthClient:
         except requests.exceptions.RequestException as e:
             logger.error(f"User info request failed: {e}")
             raise MicrosoftGraphException(f"User info request failed: {e}") from e
+
+
+@lru_cache(maxsize=None)
+def get_microsoft_auth_client() -> MicrosoftAuthClient:
+    """
+    Returns the process-wide MicrosoftAuthClient.
+
+    The client only holds settings-derived, immutable values, so it is
+    built on first use and shared by all requests.
+    """
+    return MicrosoftAuthClient()
@@ -14,11 +14,14 @@ Author: DSP Development Team
 Version: 2.0.0 (Refactored)
 """
 import logging
-from typing import Dict, Any, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Any, Tuple
 from abc import ABC, abstractmethod
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.signals import setting_changed
+from django.db import connection, transaction
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.db.models import Q
@@ -29,6 +32,23 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
+@lru_cache(maxsize=None)
+def _allowed_email_domains() -> FrozenSet[str]:
+    """Allowed login domains, lower-cased once (empty: no restriction)."""
+    return frozenset(
+        d.lower() for d in (getattr(settings, "ALLOWED_EMAIL_DOMAINS", None) or ())
+    )
+
+
+def _reset_allowed_email_domains(*, setting: str, **kwargs) -> None:
+    """Drop the cached domains when ALLOWED_EMAIL_DOMAINS is overridden."""
+    if setting == "ALLOWED_EMAIL_DOMAINS":
+        _allowed_email_domains.cache_clear()
+
+
+setting_changed.connect(_reset_allowed_email_domains)
+
+
 class BaseAuthHandler(ABC):
     """Abstract base class for an authentication handler."""
 
@@ -78,7 +98,10 @@ class EmployeeAuthHandler(BaseAuthHandler):
             raise PermissionError(f"Email domain not allowed: {email.split('@')[-1]}")
 
         try:
-            employee = Employee.objects.get(email__iexact=email, is_active=True)
+            # Department and position are rendered in the response below
+            employee = Employee.objects.select_related("department", "position").get(
+                email__iexact=email, is_active=True
+            )
         except Employee.DoesNotExist:
             raise PermissionError(f"No active employee record found for email: {email}")
 
@@ -121,11 +144,10 @@ class EmployeeAuthHandler(BaseAuthHandler):
 
     def _is_valid_domain(self, email: str) -> bool:
         """Checks if the email's domain is in the allowed list."""
-        allowed_domains = getattr(settings, "ALLOWED_EMAIL_DOMAINS", None)
+        allowed_domains = _allowed_email_domains()
         if not allowed_domains:
             return True  # Skip check if not configured
-        domain = email.split("@")[-1]
-        return domain.lower() in [d.lower() for d in allowed_domains]
+        return email.rsplit("@", 1)[-1].lower() in allowed_domains
 
     def _has_tool_access(self, employee: Employee, tool: Tool) -> bool:
         """
@@ -142,13 +164,39 @@ class EmployeeAuthHandler(BaseAuthHandler):
     ) -> Tuple[User, bool]:
         """
         Creates a new Django user or updates an existing one based on
-        the employee profile.
+        the employee profile. Existing users are only written when a
+        field actually changed, and then only the changed columns.
+
+        The email column is not unique, so concurrent callbacks for the
+        same address (double click, retry) are serialized per email.
         """
         defaults = {
             "first_name": employee.first_name,
             "last_name": employee.last_name,
         }
-        user, created = User.objects.update_or_create(
-            email=employee.email, defaults=defaults
-        )
+        with transaction.atomic():
+            self._lock_email(employee.email)
+            user, created = User.objects.get_or_create(
+                email=employee.email, defaults=defaults
+            )
+            if not created:
+                changed = [name for name, value in defaults.items() if getattr(user, name) != value]
+                if changed:
+                    for name in changed:
+                        setattr(user, name, defaults[name])
+                    user.save(update_fields=changed)
         return user, created
+
+    @staticmethod
+    def _lock_email(email: str) -> None:
+        """
+        Takes a transaction-scoped advisory lock keyed on the email.
+
+        Only PostgreSQL supports this; SQLite serializes writers anyway.
+        """
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(%s))", [email.lower()]
+            )
@@ -21,11 +21,12 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.http import HttpResponseRedirect
 from django.core.cache import cache
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.conf import settings
+from redis.exceptions import ResponseError
 
 from core.employees.models import Tool
-from .base import MicrosoftAuthClient
+from elearning.users.tokens import CacheBlacklistRefreshToken
+from .base import get_microsoft_auth_client
 from .handlers import EmployeeAuthHandler
 from ..core_integrations.exceptions import AzureAuthException, MicrosoftGraphException
 
@@ -35,6 +36,30 @@ logger = logging.getLogger(__name__)
 CALLBACK_PATH = "/api/microsoft/auth/callback/"
 
 
+def _pop_cached_value(key: str):
+    """
+    Reads and removes a cache entry in one step.
+
+    On Redis (django-redis) this is a single atomic GETDEL. Other backends,
+    or Redis servers without GETDEL (< 6.2), use get + delete, where only
+    the caller whose delete removes the key receives the value.
+    """
+    client = getattr(cache, "client", None)
+    if hasattr(client, "get_client"):
+        try:
+            raw_value = client.get_client(write=True).getdel(client.make_key(key))
+        except ResponseError as e:
+            # Unknown command: server predates GETDEL, the key is untouched
+            logger.warning(f"GETDEL unavailable, falling back to get + delete: {e}")
+        else:
+            return None if raw_value is None else client.decode(raw_value)
+
+    value = cache.get(key)
+    if value is None or not cache.delete(key):
+        return None
+    return value
+
+
 class MicrosoftLoginRedirectView(APIView):
     """
     Initiates the Microsoft OAuth 2.0 login flow for a specific tool.
@@ -54,7 +79,7 @@ class MicrosoftLoginRedirectView(APIView):
         # We store the tool_slug against the state to remember which tool started the flow
         cache.set(f"oauth_state_{state}", tool_slug, timeout=600)
 
-        client = MicrosoftAuthClient()
+        client = get_microsoft_auth_client()
         redirect_uri = request.build_absolute_uri(CALLBACK_PATH)
 
         # Azure AD often requires 'localhost' for development, not '127.0.0.1'.
@@ -112,16 +137,15 @@ class MicrosoftCallbackView(APIView):
         if not all([auth_code, state]):
             return Response({"error": "Missing 'code' or 'state' in request body."}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Verify that the tool from the URL matches the one stored in the state
-        cached_tool_slug = cache.get(f"oauth_state_{state}")
+        # Redeem the state (one-time use) and verify that the tool from the URL
+        # matches the one stored with it
+        cached_tool_slug = _pop_cached_value(f"oauth_state_{state}")
         if not cached_tool_slug or cached_tool_slug != tool_slug:
             return Response({"error": "State-Tool mismatch or expired state."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        cache.delete(f"oauth_state_{state}")
 
         try:
             tool = Tool.objects.get(slug=tool_slug, is_active=True)
-            client = MicrosoftAuthClient()
+            client = get_microsoft_auth_client()
             redirect_uri = request.build_absolute_uri(CALLBACK_PATH)
             
             # Ensure consistency for the token exchange redirect URI
@@ -129,7 +153,7 @@ class MicrosoftCallbackView(APIView):
                 redirect_uri = redirect_uri.replace("127.0.0.1", "localhost")
 
             token_data = client.exchange_code_for_token(auth_code, redirect_uri)
-            user_info = client.get_user_info(token_data["access_token"])
+            user_info = client.get_user_info_from_token_response(token_data)
 
             handler = EmployeeAuthHandler()
             auth_response_data = handler.handle_authentication(user_info, tool)
@@ -154,7 +178,8 @@ class MicrosoftLogoutView(APIView):
         if not refresh_token:
             return Response({"error": "No refresh token provided."}, status=status.HTTP_400_BAD_REQUEST)
         try:
-            token = RefreshToken(refresh_token)
+            # Same blacklist store as the e-learning token refresh/verify
+            token = CacheBlacklistRefreshToken(refresh_token)
             token.blacklist()
 
             # Prepare optional Azure logout URL
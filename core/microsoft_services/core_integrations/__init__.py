@@ -6,6 +6,7 @@ Token-Management, rollenbasierte Authentifizierung und Exception-Handling.
 
 Struktur:
 - token_manager: Azure AD Tokenverwaltung
+- http_session: Gemeinsame HTTP-Session (Connection Pooling) für Microsoft APIs
 - mixins: GraphAPI-Integrationsmixins
 - exceptions: Fehler- und Exception-Handling
 - role_authentication: Rollen- und Berechtigungslogik
@@ -17,6 +18,7 @@ Version: 1.0.0
 
 # Submodule:
 # - token_manager: Tokenverwaltung für Azure AD
+# - http_session: Gemeinsame HTTP-Session für Microsoft APIs
 # - mixins: GraphAPI-Integrationsmixins
 # - exceptions: Fehler- und Exception-Handling
 # - role_authentication: Rollen- und Berechtigungslogik 
\ No newline at end of file
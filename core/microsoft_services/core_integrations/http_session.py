@@ -0,0 +1,49 @@
+"""
+Shared HTTP Session for Microsoft Identity Platform and Graph API
+
+This module provides a process-wide ``requests.Session`` for all calls to
+login.microsoftonline.com and graph.microsoft.com. Reusing the session keeps
+TCP/TLS connections to these hosts open between requests instead of paying
+a new handshake for every token exchange or Graph call.
+
+Transient server errors (5xx) and connection failures are retried for
+idempotent methods. Rate limits (429) are not retried here; they are handled
+by ``retry_on_rate_limit`` in the Graph mixins, which honours Retry-After.
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 50
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the pooled session with retrying HTTPS adapter.
+    
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        # Return the final response so callers keep their own error handling
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+microsoft_http_session = _build_session()
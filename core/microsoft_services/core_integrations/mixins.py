@@ -22,6 +22,7 @@ import requests
 from rest_framework.response import Response
 from rest_framework import status
 
+from .http_session import microsoft_http_session
 from .token_manager import azure_token_manager
 from .exceptions import (
     MicrosoftGraphException,
@@ -94,6 +95,7 @@ class GraphAPIBaseMixin:
         GRAPH_BASE_URL (str): Base URL for Microsoft Graph API
         DEFAULT_TIMEOUT (int): Default request timeout in seconds
         MAX_RETRIES (int): Maximum retry attempts for rate-limited requests
+        MAX_BATCH_SIZE (int): Maximum sub-requests per JSON batch (Graph limit)
     
     Example:
         >>> class UserService(GraphAPIBaseMixin):
@@ -107,6 +109,7 @@ class GraphAPIBaseMixin:
     GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
     DEFAULT_TIMEOUT = 30
     MAX_RETRIES = 3
+    MAX_BATCH_SIZE = 20
     
     @retry_on_rate_limit(max_retries=3)
     def call_graph_api(
@@ -175,6 +178,7 @@ class GraphAPIBaseMixin:
                 details={'endpoint': endpoint, 'request_error': str(e)}
             )
     
+    @retry_on_rate_limit(max_retries=3)
     def call_graph_api_batch(
         self, 
         requests_data: List[Dict[str, Any]], 
@@ -185,6 +189,8 @@ class GraphAPIBaseMixin:
         
         This method allows efficient execution of multiple Graph API operations
         in a single HTTP request, reducing network overhead and improving performance.
+        The sub-requests are POSTed as one JSON batch to the $batch endpoint;
+        only GET sub-requests are accepted, so the batch stays read-only.
         
         Args:
             requests_data: List of request objects for batch processing
@@ -192,6 +198,10 @@ class GraphAPIBaseMixin:
         
         Returns:
             Batch response containing individual request results
+            (``responses`` list, each entry carrying the sub-request ``id``)
+        
+        Raises:
+            ValueError: If the batch is empty, too large or not read-only
         
         Example:
             >>> batch_requests = [
@@ -202,6 +212,8 @@ class GraphAPIBaseMixin:
         """
         if not requests_data:
             raise ValueError("Batch requests data cannot be empty")
+        if len(requests_data) > self.MAX_BATCH_SIZE:
+            raise ValueError(f"Batch requests cannot exceed {self.MAX_BATCH_SIZE} entries")
         
         # Validate batch request structure
         for req in requests_data:
@@ -212,12 +224,25 @@ class GraphAPIBaseMixin:
         
         batch_payload = {"requests": requests_data}
         
-        return self.call_graph_api(
-            "$batch",
-            params=None,
-            timeout=timeout,
-            custom_headers={"Content-Type": "application/json"}
-        )
+        try:
+            access_token = self._get_access_token()
+            url = self._build_url("$batch")
+            headers = self._build_headers(access_token)
+            request_timeout = timeout or self.DEFAULT_TIMEOUT
+            
+            logger.debug(f"Making Graph API batch call with {len(requests_data)} requests")
+            response = self._execute_batch_request(url, headers, batch_payload, request_timeout)
+            
+            return self._process_response(response, "$batch")
+            
+        except AzureAuthException:
+            raise
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Graph API batch request failed: {str(e)}")
+            raise MicrosoftGraphException(
+                f"Graph API batch request failed: {str(e)}",
+                details={'endpoint': '$batch', 'request_error': str(e)}
+            )
     
     def proxy_request(self, request, graph_path: str) -> Response:
         """
@@ -354,9 +379,10 @@ class GraphAPIBaseMixin:
         Returns:
             Complete headers dictionary for the request
         """
+        # No Content-Type: Graph GETs carry no body, and batch POSTs get
+        # it from the JSON payload
         headers = {
             'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
             'Accept': 'application/json',
             'User-Agent': 'DSP-Microsoft-Services/1.0.0'
         }
@@ -390,7 +416,7 @@ class GraphAPIBaseMixin:
             requests.RequestException: For network-related errors
         """
         try:
-            response = requests.get(
+            response = microsoft_http_session.get(
                 url,
                 headers=headers,
                 params=params,
@@ -408,6 +434,43 @@ class GraphAPIBaseMixin:
                 details={'connection_error': str(e), 'url': url}
             )
     
+    def _execute_batch_request(
+        self, 
+        url: str, 
+        headers: Dict[str, str], 
+        payload: Dict[str, Any], 
+        timeout: int
+    ) -> requests.Response:
+        """
+        Execute the JSON batch request to Microsoft Graph API.
+        
+        Args:
+            url: Complete URL of the $batch endpoint
+            headers: HTTP headers
+            payload: Batch body with the sub-requests
+            timeout: Request timeout
+        
+        Returns:
+            HTTP response object
+        """
+        try:
+            return microsoft_http_session.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=timeout
+            )
+        except requests.exceptions.Timeout:
+            raise MicrosoftGraphException(
+                f"Graph API batch request timed out after {timeout}s",
+                details={'timeout': timeout, 'url': url}
+            )
+        except requests.exceptions.ConnectionError as e:
+            raise MicrosoftGraphException(
+                f"Failed to connect to Microsoft Graph API: {str(e)}",
+                details={'connection_error': str(e), 'url': url}
+            )
+    
     def _process_response(self, response: requests.Response, endpoint: str) -> Dict[str, Any]:
         """
         Process and validate the Graph API response.
@@ -546,6 +609,11 @@ class GraphAPIBaseMixin:
         return Response(error_data, status=status_code)
 
 
+# Gemeinsame Instanz: der Mixin hält keinen eigenen Zustand, Token und
+# Verbindungen liegen threadsicher in azure_token_manager bzw. der HTTP-Session
+graph_api_client = GraphAPIBaseMixin()
+
+
 class GraphAPIUserMixin(GraphAPIBaseMixin):
     """
     Specialized mixin for Microsoft Graph API user operations.
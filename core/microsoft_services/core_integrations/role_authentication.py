@@ -21,11 +21,12 @@ from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import lru_cache
+from urllib.parse import quote
 
 from django.conf import settings
 from django.core.cache import cache
 
-from .mixins import GraphAPIBaseMixin
+from .mixins import graph_api_client
 from .exceptions import MicrosoftGraphException, ResourceNotFoundException
 
 logger = logging.getLogger(__name__)
@@ -136,7 +137,7 @@ class RoleAuthenticator:
         Args:
             custom_role_mappings: Custom role mappings to override defaults
         """
-        self.graph_mixin = GraphAPIBaseMixin()
+        self.graph_mixin = graph_api_client
         self._role_mappings = self._initialize_role_mappings(custom_role_mappings)
         self._cache_timeout = getattr(settings, 'ROLE_CACHE_TIMEOUT', 300)  # 5 minutes
         
@@ -261,6 +262,8 @@ class RoleAuthenticator:
                 f"{role_config.role_name} (Groups: {user_groups}, Reason: {assignment_reason})"
             )
             
+            # The mapping depends on this instance's role configuration, so
+            # only the user ID and groups are cached, never the result
             return RoleAssignmentResult(
                 success=True,
                 role_config=role_config,
@@ -307,21 +310,31 @@ class RoleAuthenticator:
         """
         try:
             # Use cache for user ID lookups
-            cache_key = f"ms_user_id:{email}"
+            cache_key = self._user_id_cache_key(email)
             cached_user_id = cache.get(cache_key)
             if cached_user_id:
                 logger.debug(f"Using cached user ID for {email}")
                 return cached_user_id
             
-            # Search for user by email
-            user_filter = f"mail eq '{email}' or userPrincipalName eq '{email}'"
-            search_query = f"users?$filter={user_filter}&$select=id,displayName"
-            
-            response = self.graph_mixin.call_graph_api(search_query)
-            users = response.get('value', [])
+            # Direct key lookup by user principal name (usually equals the email)
+            try:
+                response = self.graph_mixin.call_graph_api(
+                    f"users/{quote(email, safe='@')}?$select=id,displayName"
+                )
+                user_id = response.get('id')
+            except ResourceNotFoundException:
+                # Fallback for users whose mail differs from their UPN, as an
+                # advanced query (served from the directory index)
+                user_filter = f"mail eq '{email}' or userPrincipalName eq '{email}'"
+                search_query = f"users?$filter={user_filter}&$select=id,displayName&$count=true"
+                
+                response = self.graph_mixin.call_graph_api(
+                    search_query, custom_headers={'ConsistencyLevel': 'eventual'}
+                )
+                users = response.get('value', [])
+                user_id = users[0].get('id') if users else None
             
-            if users:
-                user_id = users[0].get('id')
+            if user_id:
                 # Cache user ID for future lookups
                 cache.set(cache_key, user_id, timeout=self._cache_timeout)
                 return user_id
@@ -332,6 +345,11 @@ class RoleAuthenticator:
             logger.error(f"Error retrieving user ID for {email}: {str(e)}")
             return None
     
+    @staticmethod
+    def _user_id_cache_key(email: str) -> str:
+        """Cache key for the Graph user ID (emails are case-insensitive)."""
+        return f"ms_user_id:{email.lower()}"
+    
     def _get_user_groups_cached(self, user_id: str, user_email: str) -> Optional[List[str]]:
         """
         Get user's group memberships with caching support.
@@ -370,8 +388,8 @@ class RoleAuthenticator:
             List of group display names or None if error
         """
         try:
-            # Get user's group memberships
-            groups_query = f"users/{user_id}/memberOf?$select=displayName,id,securityEnabled"
+            # Get user's group memberships (largest page size: one round trip)
+            groups_query = f"users/{user_id}/memberOf?$select=displayName,id,securityEnabled&$top=999"
             response = self.graph_mixin.call_graph_api(groups_query)
             
             groups = response.get('value', [])
@@ -435,18 +453,19 @@ class RoleAuthenticator:
             True if cache was invalidated, False if no cache existed
         """
         try:
-            # Get user ID to clear group cache
-            user_id = self._get_user_id_by_email(user_email)
+            # Cached user ID locates the group cache; without it there is
+            # nothing cached for this user, so Graph is not queried
+            user_id_key = self._user_id_cache_key(user_email)
+            user_id = cache.get(user_id_key)
             
             cache_keys = [
-                f"ms_user_id:{user_email}",
+                user_id_key,
                 f"ms_user_groups:{user_id}" if user_id else None
             ]
             
             invalidated = False
             for cache_key in cache_keys:
-                if cache_key and cache.get(cache_key):
-                    cache.delete(cache_key)
+                if cache_key and cache.delete(cache_key):
                     invalidated = True
             
             if invalidated:
@@ -24,6 +24,7 @@ from django.core.cache import cache
 from django.conf import settings
 
 from .exceptions import AzureAuthException, ServiceUnavailableException
+from .http_session import microsoft_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -208,7 +209,7 @@ class AzureTokenManager:
         try:
             logger.debug(f"Requesting token from Azure AD: {token_url}")
             
-            response = requests.post(
+            response = microsoft_http_session.post(
                 token_url,
                 data=request_data,
                 headers=headers,
@@ -370,7 +371,7 @@ class AzureTokenManager:
                 'Accept': 'application/json'
             }
             
-            response = requests.get(
+            response = microsoft_http_session.get(
                 'https://graph.microsoft.com/v1.0/organization',
                 headers=headers,
                 timeout=10
@@ -12,7 +12,7 @@ Version: 1.0.0
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from ..core_integrations.mixins import GraphAPIBaseMixin
+from ..core_integrations.mixins import graph_api_client
 from ..core_integrations.token_manager import azure_token_manager
 import logging
 
@@ -65,8 +65,7 @@ class UserReadTestView(APIView):
             
             # 2. Graph API Test mit /organization endpoint (funktioniert mit App Permissions)
             try:
-                mixin = GraphAPIBaseMixin()
-                org_info = mixin.call_graph_api('organization')
+                org_info = graph_api_client.call_graph_api('organization')
                 
                 graph_success = True
                 graph_message = "Microsoft Graph API access working"
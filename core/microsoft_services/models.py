@@ -64,6 +64,9 @@ class OAuthState(models.Model):
         ]
         ordering = ['-created_at']
     
+    # Maximale Anzahl States pro DELETE in cleanup_expired
+    CLEANUP_BATCH_SIZE = 1000
+    
     @classmethod
     def create_state(cls, state: str, user_identifier: str = None, timeout: int = 600):
         """
@@ -131,11 +134,22 @@ class OAuthState(models.Model):
         """
         Cleanup abgelaufene OAuth States
         
+        Löscht in Batches von CLEANUP_BATCH_SIZE, damit jedes DELETE nur
+        wenige Rows sperrt und parallele OAuth Logins nicht blockiert.
+        
         Returns:
             Anzahl gelöschter States
         """
         try:
-            count, _ = cls.objects.filter(expires_at__lt=timezone.now()).delete()
+            now = timezone.now()
+            count = 0
+            while True:
+                batch_ids = cls.objects.filter(expires_at__lt=now).order_by().values('id')[:cls.CLEANUP_BATCH_SIZE]
+                deleted, _ = cls.objects.filter(id__in=batch_ids).delete()
+                count += deleted
+                if deleted < cls.CLEANUP_BATCH_SIZE:
+                    break
+            
             if count > 0:
                 logger.info(f"Cleaned up {count} expired OAuth states")
             return count
@@ -2,13 +2,117 @@
 Microsoft Services Tests - DSP (Digital Solutions Platform)
 
 Dieses Modul enthält die Test-Suite für Microsoft OAuth und Integrationsdienste.
-Aktuell als Platzhalter für zukünftige Tests implementiert.
 
 Author: DSP Development Team
 Created: 10.07.2025
 Version: 1.0.0
 """
 
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import SimpleTestCase, override_settings
+
+from core.microsoft_services.authentications.base import MicrosoftAuthClient
+from core.microsoft_services.authentications.handlers import EmployeeAuthHandler
+
+TENANT_GUID = "11111111-2222-3333-4444-555555555555"
+ISSUER = f"https://login.microsoftonline.com/{TENANT_GUID}/v2.0"
+OPENID_CONFIG = {
+    "issuer": ISSUER,
+    "jwks_uri": "https://login.microsoftonline.com/common/discovery/v2.0/keys",
+}
+GRAPH_PROFILE = {"id": "graph", "mail": "graph@example.com"}
+
+
+# AZURE_TENANT_ID is a domain: the issuer must come from discovery
+@override_settings(
+    AZURE_CLIENT_ID="client-id",
+    AZURE_CLIENT_SECRET="secret",
+    AZURE_TENANT_ID="example.onmicrosoft.com",
+)
+class IdTokenUserInfoTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.signing_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def setUp(self):
+        self.client_under_test = MicrosoftAuthClient()
+        self.client_under_test._openid_config = OPENID_CONFIG
+        jwks_client = mock.Mock()
+        jwks_client.get_signing_key_from_jwt.return_value = mock.Mock(
+            key=self.signing_key.public_key()
+        )
+        self.client_under_test._jwks_client = jwks_client
+        patcher = mock.patch.object(
+            MicrosoftAuthClient, "get_user_info", return_value=GRAPH_PROFILE
+        )
+        self.get_user_info = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def makeIdToken(self, key=None, algorithm="RS256", **claims):
+        now = int(time.time())
+        payload = {
+            "aud": "client-id",
+            "iss": ISSUER,
+            "tid": TENANT_GUID,
+            "iat": now,
+            "exp": now + 600,
+            "oid": "object-id",
+            "name": "Max Mustermann",
+            "email": "max@example.com",
+            **claims,
+        }
+        return jwt.encode(payload, key or self.signing_key, algorithm=algorithm)
+
+    def userInfo(self, id_token):
+        return self.client_under_test.get_user_info_from_token_response(
+            {"access_token": "access", "id_token": id_token}
+        )
+
+    def testValidIdTokenSkipsGraph(self):
+        user_info = self.userInfo(self.makeIdToken())
+        self.assertEqual(user_info["mail"], "max@example.com")
+        self.assertEqual(user_info["id"], "object-id")
+        self.get_user_info.assert_not_called()
+
+    def testExpiredIdTokenFallsBackToGraph(self):
+        self.assertEqual(self.userInfo(self.makeIdToken(exp=int(time.time()) - 10)), GRAPH_PROFILE)
+
+    def testWrongAudienceFallsBackToGraph(self):
+        self.assertEqual(self.userInfo(self.makeIdToken(aud="other-client")), GRAPH_PROFILE)
+
+    def testWrongIssuerFallsBackToGraph(self):
+        other_issuer = "https://login.microsoftonline.com/other-tenant/v2.0"
+        self.assertEqual(self.userInfo(self.makeIdToken(iss=other_issuer)), GRAPH_PROFILE)
+
+    def testForeignSignatureFallsBackToGraph(self):
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.assertEqual(self.userInfo(self.makeIdToken(key=other_key)), GRAPH_PROFILE)
+
+    def testSymmetricAlgorithmFallsBackToGraph(self):
+        token = self.makeIdToken(key="x" * 32, algorithm="HS256")
+        self.assertEqual(self.userInfo(token), GRAPH_PROFILE)
+
+    def testMissingIdTokenFallsBackToGraph(self):
+        self.assertEqual(self.userInfo(None), GRAPH_PROFILE)
+        self.get_user_info.assert_called_once_with("access")
+
+    def testJwksClientUsesFetchTimeout(self):
+        self.client_under_test._jwks_client = None
+        jwks_client = self.client_under_test._get_jwks_client(OPENID_CONFIG)
+        self.assertEqual(jwks_client.timeout, MicrosoftAuthClient.JWKS_FETCH_TIMEOUT)
+        self.assertEqual(jwks_client.uri, OPENID_CONFIG["jwks_uri"])
+
+
+class AllowedEmailDomainTests(SimpleTestCase):
+    def testOverriddenDomainsAreApplied(self):
+        handler = EmployeeAuthHandler()
+        with override_settings(ALLOWED_EMAIL_DOMAINS=["Example.com"]):
+            self.assertTrue(handler._is_valid_domain("max@example.COM"))
+            self.assertFalse(handler._is_valid_domain("max@other.com"))
+        with override_settings(ALLOWED_EMAIL_DOMAINS=[]):
+            self.assertTrue(handler._is_valid_domain("max@other.com"))
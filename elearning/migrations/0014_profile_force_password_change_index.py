@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-16 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elearning', '0013_change_all_url_fields_to_charfield'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(condition=models.Q(('force_password_change', True)), fields=['user'], name='prof_force_pwd_user_idx'),
+        ),
+    ]
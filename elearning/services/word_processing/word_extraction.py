@@ -3,6 +3,10 @@ import json
 from typing import Dict, List, Any, Optional
 from collections import Counter
 
+# Einmalig kompilierte Muster für das Parsen von Listen-Inhalten
+_NUMBERED_LINE_PATTERN = re.compile(r'^\d+[\.\)]')
+_BULLET_PATTERN = re.compile(r'^\s*(?:[-•*]|\d+[\.\)])\s+')
+
 
 class WordExtraction:
     """
@@ -100,7 +104,7 @@ class WordExtraction:
             for line in content:
                 line = line.strip()
                 if line and (line.startswith('-') or line.startswith('•') or line.startswith('*') or 
-                           re.match(r'^\d+[\.\)]', line)):
+                           _NUMBERED_LINE_PATTERN.match(line)):
                     has_bullets = True
                     break
             
@@ -110,8 +114,6 @@ class WordExtraction:
                 return items
         
         # Normale Behandlung für Listen mit Bullets/Nummern
-        bullet_pattern = re.compile(r'^\s*(?:[-•*]|\d+[\.\)])\s+')
-        
         items = []
         current_item_lines = []
         
@@ -121,14 +123,14 @@ class WordExtraction:
                 continue
             
             # Prüfe ob diese Zeile mit einem Bullet oder einer Nummer beginnt
-            if bullet_pattern.match(line):
+            if _BULLET_PATTERN.match(line):
                 # Neues Item beginnt - speichere vorheriges Item
                 if current_item_lines:
                     items.append(' '.join(current_item_lines).strip())
                     current_item_lines = []
                 
                 # Entferne Bullet/Nummer und füge Inhalt hinzu
-                clean_line = bullet_pattern.sub('', line)
+                clean_line = _BULLET_PATTERN.sub('', line)
                 current_item_lines.append(clean_line)
             else:
                 # Zeile gehört zum aktuellen Item (Fortsetzung)
@@ -0,0 +1 @@
+#required for folder to be found by django
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+E-Learning Authentication Tests - DSP (Digital Solutions Platform)
+
+Tests für den prozesslokalen Cache verifizierter Access-Tokens
+(Treffer, Ablauf zum exp-Zeitpunkt und LRU-Verdrängung).
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from elearning.users import authentication
+from elearning.users.authentication import CachedJWTAuthentication, cache_validated_token
+
+
+class VerifiedTokenCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="Max", password="Musterpassword")
+
+    def setUp(self):
+        authentication._VERIFIED_TOKENS.clear()
+        self.addCleanup(authentication._VERIFIED_TOKENS.clear)
+        self.auth = CachedJWTAuthentication()
+
+    def rawToken(self):
+        return str(AccessToken.for_user(self.user)).encode()
+
+    def testCachedTokenSkipsVerification(self):
+        raw = self.rawToken()
+        verify_uncached = JWTAuthentication.get_validated_token
+        with mock.patch.object(
+            JWTAuthentication, 'get_validated_token',
+            side_effect=lambda token: verify_uncached(self.auth, token),
+        ) as verify:
+            first = self.auth.get_validated_token(raw)
+            second = self.auth.get_validated_token(raw)
+        self.assertIs(first, second)
+        self.assertEqual(verify.call_count, 1)
+
+    def testEntryExpiresAtTokenExp(self):
+        raw = self.rawToken()
+        token = self.auth.get_validated_token(raw)
+        valid_until, _ = authentication._VERIFIED_TOKENS[raw]
+        self.assertLessEqual(valid_until, token['exp'])
+
+        with mock.patch.object(authentication.time, 'time', return_value=token['exp']):
+            with mock.patch.object(
+                JWTAuthentication, 'get_validated_token', return_value=token
+            ) as verify:
+                self.auth.get_validated_token(raw)
+        verify.assert_called_once_with(raw)
+
+    def testExpiredTokenIsNotCached(self):
+        token = AccessToken.for_user(self.user)
+        with mock.patch.object(authentication.time, 'time', return_value=token['exp'] + 1):
+            cache_validated_token(b'expired', token)
+        self.assertNotIn(b'expired', authentication._VERIFIED_TOKENS)
+
+    def testLeastRecentlyUsedEntryIsEvicted(self):
+        token = AccessToken.for_user(self.user)
+        with mock.patch.object(authentication, '_VERIFIED_TOKENS_MAX_SIZE', 2):
+            cache_validated_token(b'a', token)
+            cache_validated_token(b'b', token)
+            # Hit on "a" makes "b" the least recently used entry
+            self.auth.get_validated_token(b'a')
+            cache_validated_token(b'c', token)
+        self.assertEqual(list(authentication._VERIFIED_TOKENS), [b'a', b'c'])
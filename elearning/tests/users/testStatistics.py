@@ -0,0 +1,61 @@
+"""
+E-Learning User Statistics Tests - DSP (Digital Solutions Platform)
+
+Tests für das Invalidieren der gecachten Benutzerstatistik über die
+User- und Profile-Signale.
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from elearning.users.models import USER_STATISTICS_CACHE_KEY
+
+
+class UserStatisticsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(username="Admin", password="Adminpassword")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def getStatistics(self):
+        response = self.client.get('/api/elearning/users/admin/users/statistics/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def testCreatedUserIsCounted(self):
+        self.assertEqual(self.getStatistics()['total_users'], 1)
+        User.objects.create_user(username="Max", password="Musterpassword")
+        self.assertEqual(self.getStatistics()['total_users'], 2)
+
+    def testDeactivatedUserIsCounted(self):
+        user = User.objects.create_user(username="Max", password="Musterpassword")
+        self.assertEqual(self.getStatistics()['active_users'], 2)
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        self.assertEqual(self.getStatistics()['active_users'], 1)
+
+    def testDeletedUserIsCounted(self):
+        user = User.objects.create_user(username="Max", password="Musterpassword")
+        self.assertEqual(self.getStatistics()['total_users'], 2)
+        User.objects.filter(pk=user.pk).delete()
+        self.assertEqual(self.getStatistics()['total_users'], 1)
+
+    def testPasswordChangeFlagIsCounted(self):
+        user = User.objects.create_user(username="Max", password="Musterpassword")
+        before = self.getStatistics()['users_requiring_password_change']
+        user.profile.mark_password_changed()
+        self.assertEqual(self.getStatistics()['users_requiring_password_change'], before - 1)
+
+    def testLoginKeepsCachedStatistics(self):
+        self.getStatistics()
+        self.admin.save(update_fields=['last_login'])
+        self.assertIsNotNone(cache.get(USER_STATISTICS_CACHE_KEY))
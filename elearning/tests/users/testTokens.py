@@ -0,0 +1,109 @@
+"""
+E-Learning Token Tests - DSP (Digital Solutions Platform)
+
+Tests für die Refresh-Token-Blacklist (Rotation, Logout und Verify),
+jeweils mit Cache-Blacklist und mit Database-Blacklist.
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from elearning.users.tokens import BLACKLIST_CACHE_ALIAS, CacheBlacklistRefreshToken
+
+
+class TokenBlacklistTestMixin:
+    # Shared flows; subclasses pin JWT_BLACKLIST_USE_CACHE
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="Max", password="Musterpassword")
+
+    def setUp(self):
+        caches[BLACKLIST_CACHE_ALIAS].clear()
+        response = self.client.post(
+            '/api/elearning/token/',
+            {'username': 'Max', 'password': 'Musterpassword'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.refresh = response.json()['refresh']
+        self.access = response.json()['access']
+
+    def refreshToken(self, token):
+        return self.client.post(
+            '/api/elearning/token/refresh/', {'refresh': token}, content_type='application/json'
+        )
+
+    def verifyToken(self, token):
+        return self.client.post(
+            '/api/elearning/token/verify/', {'token': token}, content_type='application/json'
+        )
+
+    def testRotatedTokenCannotBeReused(self):
+        response = self.refreshToken(self.refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()['refresh'], self.refresh)
+        self.assertEqual(self.refreshToken(self.refresh).status_code, 401)
+        self.assertEqual(self.refreshToken(response.json()['refresh']).status_code, 200)
+
+    def testLogoutBlacklistsRefreshToken(self):
+        response = self.client.post(
+            '/api/elearning/users/logout/',
+            {'refresh_token': self.refresh},
+            content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {self.access}',
+        )
+        self.assertEqual(response.status_code, 205)
+        self.assertEqual(self.refreshToken(self.refresh).status_code, 401)
+
+    def testMicrosoftLogoutBlacklistsRefreshToken(self):
+        response = self.client.post(
+            '/api/microsoft/auth/logout/', {'refresh': self.refresh}, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.refreshToken(self.refresh).status_code, 401)
+
+    def testVerifyRejectsBlacklistedToken(self):
+        self.assertEqual(self.verifyToken(self.refresh).status_code, 200)
+        CacheBlacklistRefreshToken(self.refresh).blacklist()
+        self.assertEqual(self.verifyToken(self.refresh).status_code, 400)
+
+
+@override_settings(JWT_BLACKLIST_USE_CACHE=True)
+class CacheTokenBlacklistTests(TokenBlacklistTestMixin, TestCase):
+
+    def testBlacklistFailsForAlreadyBlacklistedToken(self):
+        # Second of two concurrent rotations must not succeed
+        token = CacheBlacklistRefreshToken(self.refresh)
+        token.blacklist()
+        with self.assertRaises(TokenError):
+            token.blacklist()
+
+    def testDatabaseBlacklistIsStillChecked(self):
+        # Tokens revoked before the switch to the cache stay revoked
+        with self.settings(JWT_BLACKLIST_USE_CACHE=False):
+            legacy = str(RefreshToken.for_user(self.user))
+            RefreshToken(legacy).blacklist()
+        self.assertEqual(self.refreshToken(legacy).status_code, 401)
+        self.assertEqual(self.verifyToken(legacy).status_code, 400)
+        with self.settings(JWT_BLACKLIST_CHECK_DB=False):
+            self.assertEqual(self.verifyToken(legacy).status_code, 200)
+
+    def testNoOutstandingTokenRows(self):
+        self.refreshToken(self.refresh)
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+@override_settings(JWT_BLACKLIST_USE_CACHE=False)
+class DatabaseTokenBlacklistTests(TokenBlacklistTestMixin, TestCase):
+
+    def testRotationWritesDatabaseBlacklist(self):
+        self.refreshToken(self.refresh)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
@@ -12,7 +12,7 @@ URL Structure:
 - /api/exams/: Examination system and certification management
 
 Architecture Features:
-- Modular URL organization with clear namespaces
+- Modular URL organization, flattened into a single resolver level at import
 - Separation of public and authenticated endpoints
 - RESTful API design principles
 - Comprehensive endpoint coverage for all features
@@ -21,10 +21,11 @@ Author: DSP Development Team
 Version: 1.0.0
 """
 
-from typing import List
-from django.urls import path, include, URLPattern
+import re
+from typing import Iterable, List, Tuple, Union
+from django.urls import path, re_path, URLPattern, URLResolver
+from django.urls.resolvers import RegexPattern
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView
 
 # Import der Views
 from .users import views as user_views
@@ -36,21 +37,40 @@ from .final_exam import views as exam_views
 
 app_name = 'elearning'
 
-# --- Authentication and Token Management ---
 
-def _create_users_router() -> DefaultRouter:
+def _prefix(prefix: str, patterns: Iterable[Union[URLPattern, URLResolver]]) -> List[URLPattern]:
     """
-    Create and configure the router for user management endpoints.
-    
+    Flatten URL patterns under a common prefix.
+
+    Nested includes are resolved at import time so that Django's resolver
+    only has to walk a single level instead of one URLResolver per group.
+
+    Args:
+        prefix: Route prefix (plain string, no converters), e.g. 'users/'
+        patterns: URL patterns or resolvers to flatten
+
     Returns:
-        Configured DefaultRouter for user CRUD operations
+        Flat list of URLPatterns with the prefix applied
     """
-    router = DefaultRouter()
-    router.register(r'admin/users', user_views.UserCrudViewSet, basename='admin-users')
-    return router
+    flattened: List[URLPattern] = []
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            flattened.extend(_prefix(prefix + str(pattern.pattern), pattern.url_patterns))
+        elif isinstance(pattern.pattern, RegexPattern):
+            regex = '^' + re.escape(prefix) + pattern.pattern._regex.lstrip('^')
+            flattened.append(re_path(regex, pattern.callback, pattern.default_args, name=pattern.name))
+        else:
+            route = prefix + pattern.pattern._route
+            flattened.append(path(route, pattern.callback, pattern.default_args, name=pattern.name))
+    return flattened
+
+
+# --- Authentication and Token Management ---
 
-# Initialize user management router
-users_router = _create_users_router()
+# User management router; its URL patterns are materialized once at import
+users_router = DefaultRouter()
+users_router.register(r'admin/users', user_views.UserCrudViewSet, basename='admin-users')
+users_router_urls: Tuple[URLPattern, ...] = tuple(users_router.urls)
 
 # --- User Management URL Patterns ---
 
@@ -64,7 +84,7 @@ users_urlpatterns: List[URLPattern] = [
     path('register/', user_views.ExternalUserRegistrationView.as_view(), name='external-register'),
     
     # User administration endpoints (requires admin privileges)
-    path('', include(users_router.urls)),
+    *users_router_urls,
 ]
 
 # --- Learning Modules URL Patterns ---
@@ -157,11 +177,11 @@ exams_urlpatterns: List[URLPattern] = [
 urlpatterns: List[URLPattern] = [
     # Authentication endpoints (JWT token management)
     path('token/', user_views.CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('token/verify/', TokenVerifyView.as_view(), name='token_verify'),
+    path('token/refresh/', user_views.CustomTokenRefreshView.as_view(), name='token_refresh'),
+    path('token/verify/', user_views.CustomTokenVerifyView.as_view(), name='token_verify'),
     
-    # Functional area URL includes with proper namespacing
-    path('users/', include((users_urlpatterns, 'users'))),
-    path('modules/', include((modules_urlpatterns, 'modules'))),
-    path('exams/', include((exams_urlpatterns, 'exams'))),
+    # Functional areas, flattened to avoid nested URLResolver traversal per request
+    *_prefix('users/', users_urlpatterns),
+    *_prefix('modules/', modules_urlpatterns),
+    *_prefix('exams/', exams_urlpatterns),
 ]
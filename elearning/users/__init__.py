@@ -14,6 +14,9 @@ Features:
 Struktur:
 - models.py: Benutzerprofile und Signal-Handler
 - serializers.py: API-Serialisierung für Benutzerdaten
+- authentication.py: JWT-Authentifizierung mit vorgeladenem Profil
+- tokens.py: Refresh-Tokens mit Cache-basierter Blacklist
+- renderers.py: orjson-basierter JSON-Renderer für Auth-Endpunkte
 - views/: Authentifizierungs- und CRUD-Views
 - management/: Django Management Commands
 
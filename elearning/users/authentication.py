@@ -0,0 +1,195 @@
+"""
+E-Learning User Authentication Classes
+
+This module provides authentication classes for the E-Learning system
+that extend SimpleJWT's and Django's default behaviour.
+
+Classes:
+- CachedJWTAuthentication: JWT authentication that remembers recently
+  verified access tokens per process
+- ProfileJWTAuthentication: JWT authentication that loads the user together
+  with its profile in a single query
+- ProfileModelBackend: Username/password backend that loads the user together
+  with its profile in a single query
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+# Recently verified access tokens in LRU order: raw token -> (valid until, token)
+_VERIFIED_TOKENS: 'OrderedDict[bytes, Tuple[float, Token]]' = OrderedDict()
+_VERIFIED_TOKENS_LOCK = Lock()
+_VERIFIED_TOKENS_MAX_AGE = 60
+_VERIFIED_TOKENS_MAX_SIZE = 1024
+
+
+def cache_validated_token(raw_token: bytes, token: Token) -> None:
+    """
+    Remember a verified token so later requests can skip its verification.
+
+    Entries live for at most ``_VERIFIED_TOKENS_MAX_AGE`` seconds and never
+    beyond the token's own expiry. Beyond ``_VERIFIED_TOKENS_MAX_SIZE``
+    entries the least recently used one is evicted.
+
+    Args:
+        raw_token: Encoded token as sent in the Authorization header
+        token: Verified token instance
+    """
+    now = time.time()
+    valid_until = min(now + _VERIFIED_TOKENS_MAX_AGE, token['exp'])
+    if valid_until <= now:
+        return
+    with _VERIFIED_TOKENS_LOCK:
+        _VERIFIED_TOKENS[raw_token] = (valid_until, token)
+        _VERIFIED_TOKENS.move_to_end(raw_token)
+        while len(_VERIFIED_TOKENS) > _VERIFIED_TOKENS_MAX_SIZE:
+            _VERIFIED_TOKENS.popitem(last=False)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that skips signature verification for access tokens
+    verified by this process within the last minute.
+
+    The user is still loaded (and its active state checked) on every request.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """
+        Return the cached token if still fresh, otherwise verify it.
+
+        Args:
+            raw_token: Encoded token from the Authorization header
+
+        Returns:
+            Validated token instance
+
+        Raises:
+            InvalidToken: If the token cannot be validated
+        """
+        with _VERIFIED_TOKENS_LOCK:
+            cached = _VERIFIED_TOKENS.get(raw_token)
+            if cached is not None:
+                valid_until, token = cached
+                if valid_until > time.time():
+                    _VERIFIED_TOKENS.move_to_end(raw_token)
+                    return token
+                del _VERIFIED_TOKENS[raw_token]
+
+        token = super().get_validated_token(raw_token)
+        cache_validated_token(raw_token, token)
+        return token
+
+
+class ProfileJWTAuthentication(CachedJWTAuthentication):
+    """
+    JWT authentication that joins the user's profile when loading the user.
+
+    Intended for views that inspect ``request.user.profile`` (e.g. the
+    force password change flag), avoiding the lazy profile SELECT that would
+    otherwise follow the user lookup.
+    """
+
+    def get_user(self, validated_token: Token) -> Any:
+        """
+        Load the user referenced by the token with ``select_related('profile')``.
+
+        Mirrors ``JWTAuthentication.get_user`` apart from the joined profile.
+
+        Args:
+            validated_token: Validated access token
+
+        Returns:
+            User instance with its profile already cached
+
+        Raises:
+            InvalidToken: If the token carries no user identification
+            AuthenticationFailed: If the user is missing, inactive or revoked
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = self.user_model.objects.select_related('profile').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    Model backend that joins the user's profile when checking credentials.
+
+    Used by the JWT login flow, whose token serializer reads
+    ``user.profile.force_password_change`` right after authentication.
+    """
+
+    def authenticate(
+        self,
+        request: Optional[HttpRequest],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Authenticate with ``select_related('profile')`` on the user lookup.
+
+        Mirrors ``ModelBackend.authenticate`` apart from the joined profile.
+
+        Args:
+            request: Current HTTP request, if any
+            username: Username to authenticate
+            password: Raw password to check
+
+        Returns:
+            User instance with its profile cached, or None
+        """
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.select_related('profile').get(
+                **{UserModel.USERNAME_FIELD: username}
+            )
+        except UserModel.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
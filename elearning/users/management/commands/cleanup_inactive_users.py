@@ -17,6 +17,7 @@ Version: 1.0.0
 
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from django.conf import settings
@@ -27,6 +28,13 @@ User = get_user_model()
 # Logger einrichten
 logger = logging.getLogger(__name__)
 
+# Timeout aus den Settings, default 3600 Sekunden (1 Stunde) - einmalig beim Import ausgewertet.
+# Wir verwenden hier PASSWORD_RESET_TIMEOUT, da es bereits dafür gedacht ist
+PASSWORD_CHANGE_TIMEOUT = timedelta(seconds=getattr(settings, 'PASSWORD_RESET_TIMEOUT', 3600))
+
+# Format für Zeitstempel in der Ausgabe
+_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 class Command(BaseCommand):
     """
     Django Management Command für die Bereinigung inaktiver Benutzer.
@@ -42,6 +50,13 @@ class Command(BaseCommand):
     
     help = 'Löscht Benutzer, die erstellt wurden, aber ihr initiales Passwort nicht innerhalb der vorgegebenen Zeit (standardmäßig 1 Stunde) geändert haben.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Zeige nur was gelöscht werden würde, ohne tatsächlich zu löschen',
+        )
+
     def handle(self, *args, **options):
         """
         Hauptausführungsmethode für das Management Command.
@@ -53,36 +68,45 @@ class Command(BaseCommand):
         Raises:
             CommandError: Bei Fehlern während der Ausführung
         """
-        # Hole das Timeout aus den Settings, default 3600 Sekunden (1 Stunde)
-        # Wir verwenden hier PASSWORD_RESET_TIMEOUT, da es bereits dafür gedacht ist
-        timeout_seconds = getattr(settings, 'PASSWORD_RESET_TIMEOUT', 3600)
-        expiration_time = timezone.now() - timedelta(seconds=timeout_seconds)
+        expiration_time = timezone.now() - PASSWORD_CHANGE_TIMEOUT
 
-        self.stdout.write(f'Suche nach Benutzern, die vor {expiration_time.strftime("%Y-%m-%d %H:%M:%S")} erstellt wurden und deren Passwortänderung noch aussteht...')
+        self.stdout.write(f'Suche nach Benutzern, die vor {expiration_time.strftime(_DATETIME_FORMAT)} erstellt wurden und deren Passwortänderung noch aussteht...')
 
         # Finde Kandidaten zum Löschen:
-        # - Profil existiert (sollte immer der Fall sein dank Signalen)
-        # - force_password_change ist True
+        # - force_password_change ist True (impliziert ein vorhandenes Profil)
         # - date_joined (Zeit der Erstellung) ist älter als die expiration_time
         try:
-            users_to_delete = User.objects.filter(
-                profile__isnull=False,
+            candidates = User.objects.filter(
                 profile__force_password_change=True,
                 date_joined__lt=expiration_time
-            )
+            ).only('id', 'username', 'date_joined')
 
-            count = users_to_delete.count()
+            # Kandidaten in einem einzigen, gestreamten Durchlauf erfassen (und ggf. auflisten)
+            verbose = options['verbosity'] >= 2
+            if verbose:
+                self.stdout.write('Kandidaten zum Löschen:')
+            user_ids = []
+            for user in candidates.iterator(chunk_size=500):
+                user_ids.append(user.id)
+                if verbose:
+                    self.stdout.write(f'  - {user.username} (ID: {user.id}), erstellt am {user.date_joined.strftime(_DATETIME_FORMAT)}')
+
+            count = len(user_ids)
 
             if count == 0:
                 self.stdout.write(self.style.SUCCESS('Keine abgelaufenen Benutzer gefunden.'))
                 return
 
-            self.stdout.write(f'{count} Benutzer gefunden, die gelöscht werden:')
-            for user in users_to_delete:
-                self.stdout.write(f'  - {user.username} (ID: {user.id}), erstellt am {user.date_joined.strftime("%Y-%m-%d %H:%M:%S")}')
+            self.stdout.write(f'{count} Benutzer gefunden, die gelöscht werden.')
+
+            if options['dry_run']:
+                self.stdout.write(self.style.WARNING('DRY RUN - Keine Benutzer gelöscht.'))
+                return
 
-            # Führe die Löschung durch
-            deleted_count, _ = users_to_delete.delete()
+            # Führe die Löschung in einem einzigen, über die Primärschlüssel gefilterten DELETE durch
+            with transaction.atomic():
+                _, deleted_per_model = User.objects.filter(pk__in=user_ids).delete()
+            deleted_count = deleted_per_model.get(User._meta.label, 0)
 
             self.stdout.write(self.style.SUCCESS(f'{deleted_count} Benutzer erfolgreich gelöscht.'))
 
@@ -11,7 +11,7 @@ Models:
 Features:
 - Automatic profile creation for new users
 - Force password change functionality for first-time login security
-- Proper signal handling for profile lifecycle management
+- Single post_save signal handler for profile lifecycle management
 
 Author: DSP Development Team
 Version: 1.0.0
@@ -21,7 +21,8 @@ from typing import Optional
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
@@ -60,6 +61,15 @@ class Profile(models.Model):
         verbose_name = _('User Profile')
         verbose_name_plural = _('User Profiles')
         db_table = 'elearning_profile'
+        indexes = [
+            # Partial index: only profiles still awaiting their initial password change.
+            # Keyed on user_id so joins from auth_user can be answered index-only.
+            models.Index(
+                fields=['user'],
+                name='prof_force_pwd_user_idx',
+                condition=models.Q(force_password_change=True),
+            ),
+        ]
         
     def __str__(self) -> str:
         """
@@ -94,21 +104,51 @@ class Profile(models.Model):
         Mark that user has changed their password.
         
         This method should be called after a successful password change
-        to remove the force password change requirement.
+        to remove the force password change requirement. Issues a single
+        UPDATE without model save() signals.
         """
+        Profile.objects.filter(pk=self.pk).update(force_password_change=False)
         self.force_password_change = False
-        self.save(update_fields=['force_password_change'])
+        invalidate_user_statistics()
+
+
+# --- User Statistics Cache ---
+
+# Cache key of the aggregated user statistics (see UserViewSet.user_statistics)
+USER_STATISTICS_CACHE_KEY = 'elearning:user_statistics'
+
+# User fields counted by the statistics; partial saves of other fields
+# (e.g. last_login on authentication) keep the cached statistics.
+_STATISTICS_RELEVANT_USER_FIELDS = frozenset({'is_active', 'is_staff', 'is_superuser'})
+
+
+def invalidate_user_statistics() -> None:
+    """
+    Drop the cached user statistics.
+    
+    Called by the signal handlers below; code that changes users or profiles
+    through queryset update() (which sends no signals) must call it itself.
+    """
+    cache.delete(USER_STATISTICS_CACHE_KEY)
 
 
 # --- Signal Handlers for Automatic Profile Management ---
 
+# User fields whose targeted updates warrant the profile safety-net check.
+# Partial saves such as save(update_fields=['last_login']) on login skip it.
+_PROFILE_RELEVANT_USER_FIELDS = frozenset({'username', 'email', 'is_active'})
+
+
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created: bool, **kwargs) -> None:
     """
-    Automatically create a user profile when a new user is created.
+    Ensure every user has an associated profile.
     
-    This signal handler ensures that every user has an associated profile
-    without requiring manual intervention.
+    New users get a profile created immediately. For existing users the
+    profile is only created as a safety net when it is missing; an existing
+    profile is never re-saved, so ordinary user saves do not touch the
+    profile table beyond (at most) a lookup. Partial saves that only touch
+    unrelated fields (e.g. last_login on authentication) skip it entirely.
     
     Args:
         sender: The User model class
@@ -118,24 +158,44 @@ def create_user_profile(sender, instance, created: bool, **kwargs) -> None:
     """
     if created:
         Profile.objects.create(user=instance)
+        return
+    
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not (update_fields & _PROFILE_RELEVANT_USER_FIELDS):
+        return
+    
+    # Safety net for users whose profile creation was bypassed (e.g. raw loads)
+    if not hasattr(instance, 'profile'):
+        Profile.objects.get_or_create(user=instance)
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def save_user_profile(sender, instance, **kwargs) -> None:
+def invalidate_statistics_on_user_save(sender, instance, created: bool, **kwargs) -> None:
     """
-    Ensure user profile exists and is saved when user is saved.
-    
-    This signal handler provides a safety net to ensure profiles exist
-    even if the creation signal failed or was bypassed.
+    Drop the cached user statistics when a user is created or changed.
     
     Args:
         sender: The User model class
         instance: The actual User instance that was saved
+        created: Boolean indicating if this is a new instance
+        **kwargs: Additional signal arguments
+    """
+    update_fields = kwargs.get('update_fields')
+    if not created and update_fields is not None and not (update_fields & _STATISTICS_RELEVANT_USER_FIELDS):
+        return
+    invalidate_user_statistics()
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_statistics_on_change(sender, instance, **kwargs) -> None:
+    """
+    Drop the cached user statistics when a user is deleted or a profile changes.
+    
+    Args:
+        sender: The User or Profile model class
+        instance: The deleted user or the saved/deleted profile
         **kwargs: Additional signal arguments
     """
-    try:
-        # Try to save existing profile
-        instance.profile.save()
-    except Profile.DoesNotExist:
-        # Create profile if it doesn't exist
-        Profile.objects.create(user=instance) 
\ No newline at end of file
+    invalidate_user_statistics()
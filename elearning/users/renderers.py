@@ -0,0 +1,62 @@
+"""
+E-Learning User API Renderers
+
+This module provides DRF renderers for the user authentication endpoints.
+
+Renderers:
+- ORJSONRenderer: JSON renderer backed by orjson when it is installed
+- AUTH_RENDERER_CLASSES: orjson first, followed by the default renderers
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+from typing import Any, Dict, Optional
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that serializes with orjson.
+
+    Falls back to DRF's JSONRenderer when orjson is not installed or an
+    indented response is requested (``Accept: application/json; indent=4``).
+    Objects orjson cannot encode natively (e.g. lazy translation strings)
+    are converted with ``str()``.
+    """
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Render data into compact UTF-8 JSON.
+
+        Args:
+            data: Response data
+            accepted_media_type: Negotiated media type
+            renderer_context: Renderer context from the view
+
+        Returns:
+            Encoded JSON body (empty for None)
+        """
+        if not ORJSON_AVAILABLE or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=str)
+
+
+# Renderer list for the auth views: orjson for JSON clients, the default
+# renderers (e.g. the browsable API) stay available for other Accept types
+AUTH_RENDERER_CLASSES = [ORJSONRenderer, *api_settings.DEFAULT_RENDERER_CLASSES]
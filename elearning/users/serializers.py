@@ -6,7 +6,10 @@ user data management, and password operations in the E-Learning system.
 
 Serializers:
 - CustomTokenObtainPairSerializer: Enhanced JWT token with user metadata
+- CustomTokenRefreshSerializer: Token refresh with a column-only account check
+- CustomTokenVerifySerializer: Token verification against the active blacklist store
 - UserSerializer: Complete user data serialization
+- UserReadSerializer: Read-only user serialization for list/retrieve
 - SetInitialPasswordSerializer: Secure password setting with validation
 
 Features:
@@ -19,16 +22,86 @@ Author: DSP Development Team
 Version: 1.0.0
 """
 
+import copy
 from typing import Dict, Any, Optional
 from django.contrib.auth.models import User
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.exceptions import ErrorDetail
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer, TokenRefreshSerializer, TokenVerifySerializer)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
 
 from .models import Profile
+from .tokens import CacheBlacklistRefreshToken
+
+# Django's (translated) message for a taken username, as raised by UniqueValidator
+_USERNAME_TAKEN = User._meta.get_field('username').error_messages['unique']
+
+
+class CachedFieldsMixin:
+    """
+    Cache the (unbound) fields built by ``get_fields()`` per serializer class.
+    
+    ModelSerializer introspects the model and constructs every field on each
+    instantiation. The first build is stored as pristine, unbound copies and
+    later instances receive shallow copies of those, which are then bound as
+    usual. Only suitable for serializers whose fields do not depend on
+    context, instance or nested serializers.
+    """
+    
+    _fields_cache: Dict[type, Dict[str, serializers.Field]] = {}
+    
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        """
+        Return fresh copies of the cached fields for this serializer class.
+        
+        Returns:
+            Dictionary of unbound field instances
+        """
+        cls = type(self)
+        cached = CachedFieldsMixin._fields_cache.get(cls)
+        if cached is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = {
+                name: copy.copy(field) for name, field in fields.items()
+            }
+            return fields
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
+class FullNameField(serializers.Field):
+    """
+    Read-only field rendering a user's full name, falling back to the username.
+    
+    Reads the whole instance (``source='*'``) and builds the string directly,
+    avoiding the per-object method dispatch of a SerializerMethodField.
+    """
+    
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, obj: User) -> str:
+        """
+        Get formatted full name of the user.
+        
+        Args:
+            obj: User instance
+            
+        Returns:
+            Formatted full name or username if names are not available
+        """
+        if obj.first_name and obj.last_name:
+            return f"{obj.first_name} {obj.last_name}"
+        return obj.first_name or obj.last_name or obj.username
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -46,6 +119,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     - force_password_change: Password security requirement
     """
     
+    token_class = CacheBlacklistRefreshToken
+    
     @classmethod
     def get_token(cls, user: User) -> RefreshToken:
         """
@@ -57,8 +132,8 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         Returns:
             RefreshToken with additional user information
             
-        Raises:
-            Profile.DoesNotExist: If user profile is missing
+        Note:
+            A missing profile is created with the default security requirement
         """
         token = super().get_token(user)
         
@@ -68,12 +143,11 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token['is_superuser'] = user.is_superuser
         
         # Add profile-specific security settings
-        try:
-            token['force_password_change'] = user.profile.force_password_change
-        except Profile.DoesNotExist:
-            # Create missing profile and set default security requirement
-            Profile.objects.create(user=user)
-            token['force_password_change'] = True
+        profile = getattr(user, 'profile', None)
+        if profile is None:
+            # Create missing profile with the default security requirement
+            profile, _created = Profile.objects.get_or_create(user=user)
+        token['force_password_change'] = profile.force_password_change
             
         return token
     
@@ -95,13 +169,98 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             'username': self.user.username,
             'is_staff': self.user.is_staff,
             'is_superuser': self.user.is_superuser,
-            'force_password_change': getattr(self.user.profile, 'force_password_change', True)
+            'force_password_change': getattr(
+                getattr(self.user, 'profile', None), 'force_password_change', True
+            )
         })
         
         return data
 
 
-class UserSerializer(serializers.ModelSerializer):
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    JWT refresh serializer that issues the new access token without loading
+    the user instance or its profile.
+    
+    The account check is a single column query: inactive or deleted users
+    are rejected, and the role claims (username, is_staff, is_superuser)
+    are refreshed from the same row. force_password_change is copied from
+    the refresh token, so the profile is not queried.
+    """
+    
+    token_class = CacheBlacklistRefreshToken
+    
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Validate the refresh token and issue new token(s).
+        
+        Args:
+            attrs: Serializer data containing the refresh token
+            
+        Returns:
+            Dictionary with the new access token (and rotated refresh token)
+        """
+        refresh = self.token_class(attrs['refresh'])
+        
+        account = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.payload.get(api_settings.USER_ID_CLAIM)},
+            is_active=True,
+        ).values('username', 'is_staff', 'is_superuser').first()
+        if account is None:
+            raise AuthenticationFailed(
+                self.error_messages['no_active_account'],
+                'no_active_account',
+            )
+        for claim, value in account.items():
+            refresh[claim] = value
+        
+        data = {'access': str(refresh.access_token)}
+        
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            
+            data['refresh'] = str(refresh)
+        
+        return data
+
+
+class CustomTokenVerifySerializer(TokenVerifySerializer):
+    """
+    JWT verify serializer that checks the same blacklist as token refresh.
+    
+    The stock serializer only consults the database blacklist; with the
+    cache blacklist enabled (see CacheBlacklistRefreshToken) the token id
+    is looked up in the blacklist cache (and the database while
+    JWT_BLACKLIST_CHECK_DB is set).
+    """
+    
+    def validate(self, attrs: Dict[str, Any]) -> Dict[Any, Any]:
+        """
+        Validate the token signature and its blacklist status.
+        
+        Args:
+            attrs: Serializer data containing the token
+            
+        Returns:
+            Empty dictionary (the token is valid)
+        """
+        if not CacheBlacklistRefreshToken.uses_cache():
+            return super().validate(attrs)
+        
+        token = UntypedToken(attrs['token'])
+        if CacheBlacklistRefreshToken.is_jti_blacklisted(token.get(api_settings.JTI_CLAIM)):
+            raise serializers.ValidationError(_('Token is blacklisted'))
+        
+        return {}
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Comprehensive user data serializer for the E-Learning system.
     
@@ -113,7 +272,7 @@ class UserSerializer(serializers.ModelSerializer):
     """
     
     force_password_change = serializers.SerializerMethodField()
-    full_name = serializers.SerializerMethodField()
+    full_name = FullNameField()
     
     class Meta:
         model = User
@@ -125,6 +284,10 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = (
             'id', 'date_joined', 'last_login', 'is_superuser'
         )
+        extra_kwargs = {
+            # Uniqueness is checked together with the email in validate()
+            'username': {'validators': [UnicodeUsernameValidator()]},
+        }
         
     def get_force_password_change(self, obj: User) -> bool:
         """
@@ -136,74 +299,91 @@ class UserSerializer(serializers.ModelSerializer):
         Returns:
             Boolean indicating if password change is required
         """
-        try:
-            return obj.profile.force_password_change
-        except Profile.DoesNotExist:
-            return True
-            
-    def get_full_name(self, obj: User) -> str:
-        """
-        Get formatted full name of the user.
-        
-        Args:
-            obj: User instance
-            
-        Returns:
-            Formatted full name or username if names are not available
-        """
-        if obj.first_name and obj.last_name:
-            return f"{obj.first_name} {obj.last_name}"
-        elif obj.first_name:
-            return obj.first_name
-        elif obj.last_name:
-            return obj.last_name
-        return obj.username
+        # Profile is joined via setup_eager_loading on list querysets
+        return getattr(getattr(obj, 'profile', None), 'force_password_change', True)
     
-    def validate_email(self, value: str) -> str:
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet[User]) -> QuerySet[User]:
         """
-        Validate email uniqueness and format.
+        Prepare a user queryset for serialization.
+        
+        Joins the profile read by get_force_password_change and loads only
+        the columns this serializer renders (e.g. skips the password hash).
         
         Args:
-            value: Email address to validate
+            queryset: User queryset to optimize
             
         Returns:
-            Validated email address
-            
-        Raises:
-            ValidationError: If email is invalid or already exists
+            QuerySet with the profile joined and unused columns deferred
         """
-        if value:
-            # Check for existing email (excluding current user during updates)
-            user_id = self.instance.id if self.instance else None
-            if User.objects.filter(email=value).exclude(id=user_id).exists():
-                raise serializers.ValidationError(
-                    _("A user with this email address already exists.")
-                )
-        return value
-    
-    def validate_username(self, value: str) -> str:
+        return queryset.select_related('profile').only(
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'is_staff', 'is_superuser', 'is_active', 'date_joined', 'last_login',
+            'profile__force_password_change',
+        )
+            
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate username uniqueness and format.
+        Validate username and email uniqueness.
+        
+        Only values that differ from the current instance are checked, and
+        both are checked with a single query. The username conflict uses
+        Django's translated unique message. Being object-level, these errors
+        are reported once all field errors are fixed.
         
         Args:
-            value: Username to validate
+            attrs: Field-validated serializer data
             
         Returns:
-            Validated username
+            Validated data
             
         Raises:
-            ValidationError: If username is invalid or already exists
+            ValidationError: If the username or email already exists
         """
-        # Check for existing username (excluding current user during updates)
+        username = attrs.get('username')
+        email = attrs.get('email')
+        if self.instance is not None:
+            if username == self.instance.username:
+                username = None
+            if email == self.instance.email:
+                email = None
+        
+        lookup = Q()
+        if username:
+            lookup |= Q(username=username)
+        if email:
+            lookup |= Q(email=email)
+        if not lookup:
+            return attrs
+        
+        # Check for existing values (excluding current user during updates)
         user_id = self.instance.id if self.instance else None
-        if User.objects.filter(username=value).exclude(id=user_id).exists():
-            raise serializers.ValidationError(
-                _("A user with this username already exists.")
-            )
-        return value
+        errors = {}
+        conflicts = User.objects.filter(lookup).exclude(id=user_id).values_list('username', 'email')
+        for existing_username, existing_email in conflicts:
+            if username and existing_username == username:
+                errors['username'] = ErrorDetail(_USERNAME_TAKEN, code='unique')
+            if email and existing_email == email:
+                errors['email'] = _("A user with this email address already exists.")
+        
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
 
 
-class SetInitialPasswordSerializer(serializers.Serializer):
+class UserReadSerializer(UserSerializer):
+    """
+    Read-only variant of UserSerializer for list and retrieve operations.
+    
+    All fields are read-only, so DRF builds no writable field machinery
+    (validators, uniqueness checks) for responses that never write.
+    """
+    
+    class Meta(UserSerializer.Meta):
+        read_only_fields = UserSerializer.Meta.fields
+
+
+class SetInitialPasswordSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Secure password setting serializer with comprehensive validation.
     
@@ -244,6 +424,9 @@ class SetInitialPasswordSerializer(serializers.Serializer):
         Raises:
             ValidationError: If password doesn't meet security requirements
         """
+        # Imported lazily; only this endpoint needs the configured validators
+        from django.contrib.auth.password_validation import validate_password
+        
         try:
             validate_password(value)
         except DjangoValidationError as e:
@@ -289,19 +472,23 @@ class SetInitialPasswordSerializer(serializers.Serializer):
         """
         password = self.validated_data['password']
         user.set_password(password)
-        user.save()
         
-        # Update profile to remove force password change requirement
-        try:
-            user.profile.mark_password_changed()
-        except Profile.DoesNotExist:
-            # Create profile if it doesn't exist
-            Profile.objects.create(user=user, force_password_change=False)
+        # Both single-column writes are committed together
+        with transaction.atomic():
+            user.save(update_fields=['password'])
+            
+            # Update profile to remove force password change requirement
+            profile = getattr(user, 'profile', None)
+            if profile is not None:
+                profile.mark_password_changed()
+            else:
+                # Create profile if it doesn't exist
+                Profile.objects.update_or_create(user=user, defaults={'force_password_change': False})
             
         return user
 
 
-class ExternalUserRegistrationSerializer(serializers.ModelSerializer):
+class ExternalUserRegistrationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for registering external users (non-company, non-Microsoft) on the platform.
 
@@ -339,21 +526,33 @@ class ExternalUserRegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['username', 'email', 'first_name', 'password', 'password_confirm']
-
-    def validate_email(self, value):
-        """
-        Ensure the provided email is unique within the User model.
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
+        extra_kwargs = {
+            # Uniqueness is checked together with the email in validate()
+            'username': {'validators': [UnicodeUsernameValidator()]},
+        }
 
     def validate(self, data):
         """
-        Object-level validation to ensure passwords match.
+        Object-level validation to ensure passwords match and that neither the
+        username nor the email is taken (checked with a single query). These
+        errors are reported once all field errors are fixed.
         """
+        errors = {}
         if data['password'] != data['password_confirm']:
-            raise serializers.ValidationError({"password_confirm": "Passwords do not match"})
+            errors['password_confirm'] = "Passwords do not match"
+
+        email = data.get('email')
+        lookup = Q(username=data['username'])
+        if email:
+            lookup |= Q(email=email)
+        for existing_email, existing_username in User.objects.filter(lookup).values_list('email', 'username'):
+            if existing_username == data['username']:
+                errors['username'] = ErrorDetail(_USERNAME_TAKEN, code='unique')
+            if email and existing_email == email:
+                errors['email'] = "A user with this email already exists."
+
+        if errors:
+            raise serializers.ValidationError(errors)
         return data
 
     def create(self, validated_data):
@@ -371,15 +570,14 @@ class ExternalUserRegistrationSerializer(serializers.ModelSerializer):
         password = validated_data.pop('password')
         validated_data.pop('password_confirm')
 
-        # Create the user instance using Django's built-in create-user method
-        user = User.objects.create_user(**validated_data)
+        # Build the user with the same normalization as create_user() and save it once
+        validated_data['username'] = User.normalize_username(validated_data['username'])
+        validated_data['email'] = User.objects.normalize_email(validated_data.get('email', ''))
+        user = User(**validated_data)
+        user.set_password(password)
         user.save()
 
-        # Ensure the associated Profile exists, and set force_password_change to False
-        if hasattr(user, 'profile'):
-            user.profile.force_password_change = False
-            user.profile.save()
-        else:
-            Profile.objects.create(user=user, force_password_change=False)
+        # Ensure the associated Profile exists with force_password_change set to False
+        Profile.objects.update_or_create(user=user, defaults={'force_password_change': False})
 
         return user
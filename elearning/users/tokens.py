@@ -0,0 +1,155 @@
+"""
+E-Learning JWT Token Classes
+
+This module provides SimpleJWT token classes for the E-Learning system.
+
+Classes:
+- CacheBlacklistRefreshToken: Refresh token whose blacklist lives in a
+  dedicated Redis cache instead of the database
+
+The cache blacklist is only used when JWT_BLACKLIST_USE_CACHE is set (by
+default only with JWT_BLACKLIST_REDIS_URL, a Redis configured not to evict
+keys). A per-process LocMem cache would give every worker its own blacklist,
+so without that store the database blacklist is kept.
+
+Author: DSP Development Team
+Version: 1.0.0
+"""
+
+import time
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+
+# Cache alias and key prefix for blacklisted token ids
+BLACKLIST_CACHE_ALIAS = 'jwt_blacklist'
+BLACKLIST_CACHE_PREFIX = 'jwt:bl:'
+
+
+class CacheBlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token blacklisted through the JWT blacklist cache.
+
+    Blacklisting adds the token id with a TTL equal to the token's remaining
+    lifetime; the add fails if the id is already present, so two concurrent
+    rotations of the same token cannot both succeed. Tokens are not recorded
+    in the outstanding token table.
+
+    While JWT_BLACKLIST_CHECK_DB is set, the database blacklist is checked
+    as well, so tokens revoked before the switch to the cache stay revoked.
+
+    With the cache blacklist disabled every method falls back to the stock
+    database blacklist of SimpleJWT.
+    """
+
+    # Bind the shared backend (and its prepared key) up front instead of
+    # resolving it by import path on every token instance
+    _token_backend = token_backend
+
+    @staticmethod
+    def uses_cache() -> bool:
+        """
+        Whether the blacklist lives in the cache instead of the database.
+
+        Returns:
+            True if JWT_BLACKLIST_USE_CACHE is enabled
+        """
+        return getattr(settings, 'JWT_BLACKLIST_USE_CACHE', False)
+
+    @staticmethod
+    def cache_key_for(jti: Any) -> str:
+        """
+        Cache key marking the given token id as blacklisted.
+
+        Args:
+            jti: Token id (JTI claim)
+
+        Returns:
+            Cache key derived from the token id
+        """
+        return BLACKLIST_CACHE_PREFIX + str(jti)
+
+    @classmethod
+    def is_jti_blacklisted(cls, jti: Any) -> bool:
+        """
+        Check the cache blacklist (and the database blacklist if enabled).
+
+        Args:
+            jti: Token id (JTI claim)
+
+        Returns:
+            True if the token id is blacklisted
+        """
+        if caches[BLACKLIST_CACHE_ALIAS].get(cls.cache_key_for(jti)) is not None:
+            return True
+        if getattr(settings, 'JWT_BLACKLIST_CHECK_DB', True):
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+        return False
+
+    @classmethod
+    def for_user(cls, user: Any) -> 'CacheBlacklistRefreshToken':
+        """
+        Create a refresh token for the user.
+
+        With the cache blacklist no outstanding token row is written.
+
+        Args:
+            user: User the token is issued for
+
+        Returns:
+            New refresh token
+        """
+        if not cls.uses_cache():
+            return super().for_user(user)
+        return super(BlacklistMixin, cls).for_user(user)
+
+    @property
+    def blacklist_key(self) -> str:
+        """
+        Cache key marking this token as blacklisted.
+
+        Returns:
+            Cache key derived from the token id
+        """
+        return self.cache_key_for(self.payload[api_settings.JTI_CLAIM])
+
+    def check_blacklist(self) -> None:
+        """
+        Raise if this token has been blacklisted.
+
+        Raises:
+            TokenError: If the token id is present in the blacklist
+        """
+        if not self.uses_cache():
+            return super().check_blacklist()
+        if self.is_jti_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> Optional[Any]:
+        """
+        Add this token to the blacklist until it expires.
+
+        Raises:
+            TokenError: If the token was blacklisted concurrently
+        """
+        if not self.uses_cache():
+            return super().blacklist()
+        timeout = max(int(self.payload['exp'] - time.time()), 1)
+        if not caches[BLACKLIST_CACHE_ALIAS].add(self.blacklist_key, True, timeout=timeout):
+            raise TokenError(_("Token is blacklisted"))
+        return None
+
+    def outstand(self) -> Optional[Any]:
+        """
+        Record the token as outstanding (database blacklist only).
+        """
+        if not self.uses_cache():
+            return super().outstand()
+        return None
@@ -17,6 +17,8 @@ Version: 1.0.0
 
 from .auth_views import (
     CustomTokenObtainPairView,
+    CustomTokenRefreshView,
+    CustomTokenVerifyView,
     LogoutView,
     SetInitialPasswordView,
     ExternalUserRegistrationView,
@@ -6,6 +6,8 @@ including enhanced JWT token generation and secure logout functionality.
 
 Views:
 - CustomTokenObtainPairView: Enhanced JWT authentication with user metadata
+- CustomTokenRefreshView: JWT refresh with a column-only account check
+- CustomTokenVerifyView: JWT verification against the active blacklist store
 - LogoutView: Secure token invalidation and logout
 - SetInitialPasswordView: Secure initial password setting for new users
 
@@ -19,23 +21,100 @@ Author: DSP Development Team
 Version: 1.0.0
 """
 
+import json
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from django.contrib.auth.models import User
-from django.utils.translation import gettext_lazy as _
+from django.db import DatabaseError
+from django.http import HttpRequest, HttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.translation import get_language, gettext, gettext_noop
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status, generics
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView
 
 
+from ..authentication import CachedJWTAuthentication, ProfileJWTAuthentication, cache_validated_token
 from ..models import Profile
+from ..renderers import AUTH_RENDERER_CLASSES, ORJSONRenderer
 from ..serializers import (
-    CustomTokenObtainPairSerializer,
+    CustomTokenObtainPairSerializer, CustomTokenRefreshSerializer, CustomTokenVerifySerializer,
     SetInitialPasswordSerializer, ExternalUserRegistrationSerializer)
+from ..tokens import CacheBlacklistRefreshToken
+
+
+# Fixed response messages (translated when rendered)
+_MSG_LOGGED_OUT_NO_TOKEN = gettext_noop('Successfully logged out (client-side cleanup recommended).')
+_MSG_LOGGED_OUT_BLACKLISTED = gettext_noop('Successfully logged out and token blacklisted.')
+_MSG_LOGGED_OUT_INVALID_TOKEN = gettext_noop('Successfully logged out (token was invalid).')
+_MSG_PASSWORD_ALREADY_SET = gettext_noop('Password has already been set.')
+_MSG_NOT_AUTHENTICATED = gettext_noop('Authentication credentials were not provided.')
+_MSG_INVALID_JSON = gettext_noop('Invalid JSON body.')
+_MSG_AUTHENTICATION_FAILED = gettext_noop('Authentication failed. Please check your credentials.')
+_MSG_PASSWORD_SET_ERROR = gettext_noop('An error occurred while setting the password.')
+_MSG_PASSWORD_SET = gettext_noop('Password successfully set.')
+_MSG_REGISTRATION_SUCCESSFUL = gettext_noop('Registration successful.')
+
+
+@lru_cache(maxsize=None)
+def _translate(message: str, language: Optional[str]) -> str:
+    """
+    Translate a fixed message, cached per message and language.
+
+    Args:
+        message: Untranslated message
+        language: Active language code (cache key only)
+
+    Returns:
+        Translated message as a plain string
+    """
+    return gettext(message)
+
+
+@lru_cache(maxsize=None)
+def _render_detail(message: str, language: Optional[str]) -> bytes:
+    """
+    Render ``{"detail": <translated message>}`` as JSON bytes.
+
+    Cached per message and language; the output matches DRF's JSONRenderer.
+
+    Args:
+        message: Untranslated message
+        language: Active language code (cache key only)
+
+    Returns:
+        UTF-8 encoded JSON body
+    """
+    return json.dumps(
+        {'detail': _translate(message, language)}, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def _detail_response(message: str, status_code: int) -> HttpResponse:
+    """
+    Build a JSON ``detail`` response from a precomputed body.
+
+    Skips DRF's Response rendering for fixed messages.
+
+    Args:
+        message: Untranslated message
+        status_code: HTTP status code
+
+    Returns:
+        JSON HttpResponse
+    """
+    return HttpResponse(
+        _render_detail(message, get_language()),
+        status=status_code,
+        content_type='application/json'
+    )
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -53,6 +132,7 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     """
     
     serializer_class = CustomTokenObtainPairSerializer
+    renderer_classes = AUTH_RENDERER_CLASSES
     
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
@@ -72,37 +152,83 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         try:
             response = super().post(request, *args, **kwargs)
             
-            # Log successful authentication
-            if response.status_code == status.HTTP_200_OK and hasattr(self, 'user'):
-                # Could add audit logging here
-                pass
+            if response.status_code == status.HTTP_200_OK:
+                # Pre-verify the freshly minted access token for follow-up requests
+                access = response.data['access']
+                cache_validated_token(access.encode(), AccessToken(access, verify=False))
                 
             return response
             
         except Exception as e:
             # Log authentication failure
             return Response(
-                {'detail': _('Authentication failed. Please check your credentials.')},
+                {'detail': _translate(_MSG_AUTHENTICATION_FAILED, get_language())},
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
 
-class LogoutView(APIView):
+class CustomTokenRefreshView(TokenRefreshView):
+    """
+    JWT token refresh view without loading the user instance or profile.
+    
+    The new access token carries the custom claims of the refresh token;
+    besides the signature and blacklist checks, refreshing only runs a
+    column-only query that rejects inactive or deleted accounts.
+    """
+    
+    serializer_class = CustomTokenRefreshSerializer
+    renderer_classes = AUTH_RENDERER_CLASSES
+    
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Refresh the access token and pre-verify it for follow-up requests.
+        
+        Args:
+            request: HTTP request containing the refresh token
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments
+            
+        Returns:
+            Response containing the new access (and rotated refresh) token
+        """
+        response = super().post(request, *args, **kwargs)
+        
+        if response.status_code == status.HTTP_200_OK:
+            access = response.data['access']
+            cache_validated_token(access.encode(), AccessToken(access, verify=False))
+        
+        return response
+
+
+class CustomTokenVerifyView(TokenVerifyView):
+    """
+    JWT token verify view using the same blacklist store as refresh and logout.
+    """
+    
+    serializer_class = CustomTokenVerifySerializer
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class LogoutView(View):
     """
     Secure user logout view with token blacklisting.
     
     Provides secure logout functionality by blacklisting the refresh token
     to prevent its reuse, ensuring proper session termination.
     
+    Implemented as a plain Django view: authentication is a direct JWT
+    check, without DRF's negotiation, permission and throttling pipeline.
+    Like APIView, it is exempt from CSRF checks (token authentication).
+    
     Security Features:
     - Token blacklisting to prevent reuse
     - Comprehensive error handling for invalid tokens
     - Proper HTTP status codes for different scenarios
     """
     
-    permission_classes = (IsAuthenticated,)
+    authentication = CachedJWTAuthentication()
     
-    def post(self, request: Request) -> Response:
+    def post(self, request: HttpRequest) -> HttpResponse:
         """
         Logout user by blacklisting their refresh token.
         
@@ -120,40 +246,60 @@ class LogoutView(APIView):
             Frontend should handle token cleanup locally.
         """
         try:
-            refresh_token = request.data.get("refresh_token")
-            
-            if not refresh_token:
-                # Graceful logout even without refresh_token
-                # Frontend can handle local token cleanup
-                return Response(
-                    {'detail': _('Successfully logged out (client-side cleanup recommended).')},
-                    status=status.HTTP_205_RESET_CONTENT
-                )
-            
+            authenticated = self.authentication.authenticate(request)
+        except AuthenticationFailed as exc:
+            return self._unauthorized(request, exc.detail)
+        if authenticated is None:
+            return self._unauthorized(request, {'detail': _translate(_MSG_NOT_AUTHENTICATED, get_language())})
+        
+        if request.content_type == 'application/json':
+            try:
+                data = json.loads(request.body or b'{}')
+            except ValueError:
+                return _detail_response(_MSG_INVALID_JSON, status.HTTP_400_BAD_REQUEST)
+            if not isinstance(data, dict):
+                data = {}
+        else:
+            data = request.POST
+        refresh_token = data.get("refresh_token")
+        
+        if not refresh_token:
+            # Graceful logout even without refresh_token
+            # Frontend can handle local token cleanup
+            return _detail_response(_MSG_LOGGED_OUT_NO_TOKEN, status.HTTP_205_RESET_CONTENT)
+        
+        try:
             # Blacklist the refresh token if provided
-            token = RefreshToken(refresh_token)
-            token.blacklist()
-            
-            # Log successful logout with token blacklisting
-            # Could add audit logging here
-            
-            return Response(
-                {'detail': _('Successfully logged out and token blacklisted.')},
-                status=status.HTTP_205_RESET_CONTENT
-            )
-            
-        except TokenError as e:
+            CacheBlacklistRefreshToken(refresh_token).blacklist()
+        except TokenError:
             # Even if token is invalid, allow logout to succeed for UX
-            return Response(
-                {'detail': _('Successfully logged out (token was invalid).')},
-                status=status.HTTP_205_RESET_CONTENT
-            )
-        except Exception as e:
-            # Fallback: allow logout to succeed even if blacklisting fails
-            return Response(
-                {'detail': _('Successfully logged out (error during token blacklisting).')},
-                status=status.HTTP_205_RESET_CONTENT
-            )
+            return _detail_response(_MSG_LOGGED_OUT_INVALID_TOKEN, status.HTTP_205_RESET_CONTENT)
+        
+        # Log successful logout with token blacklisting
+        # Could add audit logging here
+        
+        return _detail_response(_MSG_LOGGED_OUT_BLACKLISTED, status.HTTP_205_RESET_CONTENT)
+    
+    def _unauthorized(self, request: HttpRequest, detail: Any) -> HttpResponse:
+        """
+        Build the 401 response DRF would return for failed authentication.
+        
+        Args:
+            request: HTTP request
+            detail: Error detail (string or dictionary)
+            
+        Returns:
+            JSON HttpResponse with WWW-Authenticate header
+        """
+        if not isinstance(detail, dict):
+            detail = {'detail': detail}
+        response = HttpResponse(
+            ORJSONRenderer().render(detail),
+            status=status.HTTP_401_UNAUTHORIZED,
+            content_type='application/json'
+        )
+        response['WWW-Authenticate'] = self.authentication.authenticate_header(request)
+        return response
 
 
 class SetInitialPasswordView(APIView):
@@ -171,7 +317,10 @@ class SetInitialPasswordView(APIView):
     - Automatic profile update after successful password change
     """
     
+    # Loads request.user together with its profile (one query instead of two)
+    authentication_classes = [ProfileJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    renderer_classes = AUTH_RENDERER_CLASSES
     
     def post(self, request: Request) -> Response:
         """
@@ -194,42 +343,32 @@ class SetInitialPasswordView(APIView):
         """
         user = request.user
         
-        try:
-            # Check if user is required to change password
-            if not user.profile.force_password_change:
-                return Response(
-                    {'detail': _('Password has already been set.')},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        except Profile.DoesNotExist:
+        profile = getattr(user, 'profile', None)
+        if profile is None:
             # Create missing profile
-            Profile.objects.create(user=user, force_password_change=True)
+            Profile.objects.get_or_create(user=user, defaults={'force_password_change': True})
+        elif not profile.force_password_change:
+            # User is not required to change password
+            return _detail_response(_MSG_PASSWORD_ALREADY_SET, status.HTTP_400_BAD_REQUEST)
         
-        # Validate and process password change
+        # Validate and process password change (invalid data -> 400 via DRF)
         serializer = SetInitialPasswordSerializer(data=request.data)
-        if serializer.is_valid():
-            try:
-                # Use serializer's save method for comprehensive handling
-                updated_user = serializer.save(user)
-                
-                # Log successful password change
-                # Could add audit logging here
-                
-                return Response(
-                    {'detail': _('Password successfully set.')},
-                    status=status.HTTP_200_OK
-                )
-                
-            except Exception as e:
-                return Response(
-                    {'detail': _('An error occurred while setting the password.')},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
+        serializer.is_valid(raise_exception=True)
         
-        return Response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        try:
+            # Use serializer's save method for comprehensive handling
+            updated_user = serializer.save(user)
+            
+            # Log successful password change
+            # Could add audit logging here
+            
+            return _detail_response(_MSG_PASSWORD_SET, status.HTTP_200_OK)
+            
+        except DatabaseError:
+            return Response(
+                {'detail': _translate(_MSG_PASSWORD_SET_ERROR, get_language())},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
 
 class ExternalUserRegistrationView(generics.CreateAPIView):
@@ -252,6 +391,7 @@ class ExternalUserRegistrationView(generics.CreateAPIView):
     """
 
     serializer_class = ExternalUserRegistrationSerializer
+    renderer_classes = AUTH_RENDERER_CLASSES
 
     def post(self, request, *args, **kwargs):
         """
@@ -280,14 +420,7 @@ class ExternalUserRegistrationView(generics.CreateAPIView):
         # Initialize the serializer with the incoming data
         serializer = self.get_serializer(data=request.data)
 
-        # Validate the data
-        if serializer.is_valid():
-            user = serializer.save()
-            return Response(
-                {"detail": _("Registration successful.")},
-                status=status.HTTP_201_CREATED
-            )
-        return Response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        # Validate the data; errors are returned as HTTP 400 by DRF's exception handler
+        serializer.is_valid(raise_exception=True)
+        user = serializer.save()
+        return _detail_response(_MSG_REGISTRATION_SUCCESSFUL, status.HTTP_201_CREATED)
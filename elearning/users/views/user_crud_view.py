@@ -21,15 +21,18 @@ Version: 1.0.0
 
 from typing import Any, Dict, Optional
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet
+from django.http import Http404
 from django.utils.translation import gettext_lazy as _
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from ..models import Profile
-from ..serializers import UserSerializer
+from ..models import USER_STATISTICS_CACHE_KEY, Profile, invalidate_user_statistics
+from ..serializers import UserReadSerializer, UserSerializer
 
 
 class UserCrudViewSet(viewsets.ModelViewSet):
@@ -54,14 +57,49 @@ class UserCrudViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAdminUser]
     
+    # Statistics are shared by all admins and invalidated by the write actions
+    statistics_cache_key = USER_STATISTICS_CACHE_KEY
+    statistics_cache_timeout = 60
+    
     def get_queryset(self) -> QuerySet[User]:
         """
-        Get optimized queryset with profile prefetching.
+        Get an optimized queryset for the current action.
+        
+        Serializing actions use UserSerializer.setup_eager_loading, which
+        selects the rendered columns together with the profile. Deletion
+        only needs the primary key.
+        
+        Returns:
+            Optimized QuerySet for the current action
+        """
+        if self.action == 'destroy':
+            return User.objects.only('id')
+        return UserSerializer.setup_eager_loading(User.objects.all()).order_by('id')
+    
+    def get_object(self) -> User:
+        """
+        Get the requested user, loading it at most once per request.
+        
+        The viewset instance lives for a single request, so repeated calls
+        (e.g. from custom actions or hooks) reuse the first lookup.
+        
+        Returns:
+            User instance for the URL's primary key
+        """
+        if getattr(self, '_object', None) is None:
+            self._object = super().get_object()
+        return self._object
+    
+    def get_serializer_class(self) -> type:
+        """
+        Use the read-only serializer for safe (read) requests.
         
         Returns:
-            Optimized QuerySet with related profile data
+            UserReadSerializer for GET/HEAD/OPTIONS, UserSerializer otherwise
         """
-        return User.objects.select_related('profile').order_by('id')
+        if self.request.method in permissions.SAFE_METHODS:
+            return UserReadSerializer
+        return UserSerializer
     
     def perform_create(self, serializer: UserSerializer) -> None:
         """
@@ -75,11 +113,14 @@ class UserCrudViewSet(viewsets.ModelViewSet):
             - Automatically creates associated profile
             - Sets force_password_change to True for security
         """
-        user = serializer.save()
-        
-        # Ensure profile exists (signal should handle this, but safety check)
-        if not hasattr(user, 'profile'):
-            Profile.objects.create(user=user, force_password_change=True)
+        # User and profile are committed together
+        with transaction.atomic():
+            user = serializer.save()
+            
+            # Ensure profile exists (signal should handle this, but safety check).
+            # The signal's profile is cached on the user, so this is no query.
+            if getattr(user, 'profile', None) is None:
+                Profile.objects.get_or_create(user=user, defaults={'force_password_change': True})
     
     def perform_update(self, serializer: UserSerializer) -> None:
         """
@@ -92,11 +133,12 @@ class UserCrudViewSet(viewsets.ModelViewSet):
             - Updates user instance
             - Maintains profile integrity
         """
-        user = serializer.save()
-        
-        # Ensure profile exists after update
-        if not hasattr(user, 'profile'):
-            Profile.objects.create(user=user, force_password_change=True)
+        with transaction.atomic():
+            user = serializer.save()
+            
+            # Ensure profile exists after update (joined by get_queryset, no query)
+            if getattr(user, 'profile', None) is None:
+                Profile.objects.get_or_create(user=user, defaults={'force_password_change': True})
     
     def perform_destroy(self, instance: User) -> None:
         """
@@ -112,6 +154,37 @@ class UserCrudViewSet(viewsets.ModelViewSet):
         # (e.g., handling user-related data, logging, etc.)
         super().perform_destroy(instance)
     
+    def _set_force_password_change(self, pk: Optional[str], value: bool) -> bool:
+        """
+        Set the password change flag with a single UPDATE on the profile.
+        
+        The user is not loaded; only if no profile row was updated is the
+        user's existence checked and the missing profile created.
+        
+        Args:
+            pk: User primary key
+            value: New force_password_change value
+            
+        Returns:
+            True if a profile had to be created, False if it was updated
+            
+        Raises:
+            Http404: If no user with this primary key exists
+        """
+        try:
+            updated = Profile.objects.filter(user_id=pk).update(force_password_change=value)
+        except (TypeError, ValueError):
+            raise Http404
+        
+        if not updated:
+            if not User.objects.filter(pk=pk).exists():
+                raise Http404
+            Profile.objects.get_or_create(user_id=pk, defaults={'force_password_change': value})
+        
+        # The UPDATE above sends no save signal
+        invalidate_user_statistics()
+        return not updated
+    
     @action(
         detail=True,
         methods=['post'],
@@ -129,29 +202,25 @@ class UserCrudViewSet(viewsets.ModelViewSet):
         Returns:
             Response indicating success or failure
         """
-        user = self.get_object()
-        
         try:
-            user.profile.force_password_change = True
-            user.profile.save(update_fields=['force_password_change'])
-            
+            created = self._set_force_password_change(pk, True)
+        except Http404:
+            raise
+        except Exception as e:
             return Response(
-                {'detail': _('User will be required to change password on next login.')},
-                status=status.HTTP_200_OK
+                {'detail': _('An error occurred while updating password requirements.')},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except Profile.DoesNotExist:
-            # Create profile if it doesn't exist
-            Profile.objects.create(user=user, force_password_change=True)
-            
+        
+        if created:
             return Response(
                 {'detail': _('Profile created and user will be required to change password.')},
                 status=status.HTTP_200_OK
             )
-        except Exception as e:
-            return Response(
-                {'detail': _('An error occurred while updating password requirements.')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return Response(
+            {'detail': _('User will be required to change password on next login.')},
+            status=status.HTTP_200_OK
+        )
     
     @action(
         detail=True,
@@ -170,29 +239,25 @@ class UserCrudViewSet(viewsets.ModelViewSet):
         Returns:
             Response indicating success or failure
         """
-        user = self.get_object()
-        
         try:
-            user.profile.force_password_change = False
-            user.profile.save(update_fields=['force_password_change'])
-            
+            created = self._set_force_password_change(pk, False)
+        except Http404:
+            raise
+        except Exception as e:
             return Response(
-                {'detail': _('Password change requirement removed for user.')},
-                status=status.HTTP_200_OK
+                {'detail': _('An error occurred while updating password requirements.')},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        except Profile.DoesNotExist:
-            # Create profile if it doesn't exist
-            Profile.objects.create(user=user, force_password_change=False)
-            
+        
+        if created:
             return Response(
                 {'detail': _('Profile created without password change requirement.')},
                 status=status.HTTP_200_OK
             )
-        except Exception as e:
-            return Response(
-                {'detail': _('An error occurred while updating password requirements.')},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return Response(
+            {'detail': _('Password change requirement removed for user.')},
+            status=status.HTTP_200_OK
+        )
     
     @action(
         detail=False,
@@ -204,24 +269,31 @@ class UserCrudViewSet(viewsets.ModelViewSet):
         """
         Get user statistics for administrative overview.
         
+        The result is cached briefly and dropped by the user and profile
+        signal handlers whenever a user or profile is written.
+        
         Args:
             request: HTTP request
             
         Returns:
             Response containing user statistics
         """
+        statistics = cache.get(self.statistics_cache_key)
+        if statistics is not None:
+            return Response(statistics, status=status.HTTP_200_OK)
+        
         try:
-            queryset = self.get_queryset()
-            
-            statistics = {
-                'total_users': queryset.count(),
-                'active_users': queryset.filter(is_active=True).count(),
-                'staff_users': queryset.filter(is_staff=True).count(),
-                'superusers': queryset.filter(is_superuser=True).count(),
-                'users_requiring_password_change': queryset.filter(
-                    profile__force_password_change=True
-                ).count(),
-            }
+            # Single query with filtered aggregates (no join/ordering needed)
+            statistics = User.objects.aggregate(
+                total_users=Count('id'),
+                active_users=Count('id', filter=Q(is_active=True)),
+                staff_users=Count('id', filter=Q(is_staff=True)),
+                superusers=Count('id', filter=Q(is_superuser=True)),
+                users_requiring_password_change=Count(
+                    'id', filter=Q(profile__force_password_change=True)
+                ),
+            )
+            cache.set(self.statistics_cache_key, statistics, timeout=self.statistics_cache_timeout)
             
             return Response(statistics, status=status.HTTP_200_OK)
             
@@ -5,13 +5,110 @@ Verarbeitet alle Word-Dateien im DSP Root-Ordner und erstellt JSON-Analysen.
 Falls Word-Dateien nicht geladen werden können, repariert die bestehenden JSON-Dateien.
 """
 
+import io
 import os
+import sys
 import json
-import glob
 import re
-from typing import List
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache, partial
+from typing import Any, List, Optional, Tuple
 from docx import Document
-from elearning.services.word_extraction import WordExtraction
+from docx.text.paragraph import Paragraph
+from elearning.services.word_processing.word_extraction import WordExtraction
+
+# Schneller JSON-Parser/-Serializer (optional, Fallback auf stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Kapitelnummer im Dateinamen, z.B. "1.1 Installation..." -> "1.1"
+_CHAPTER_RE = re.compile(r"(\d+\.\d+)")
+
+# Alle verfügbaren Tags für die Tag-Analyse-Ausgabe
+_ALL_TAGS = (
+    'Titel$', 'Titel2$', 'Titel3$', 'Text$', 'Hinweis$', 'Exkurs$',
+    'Quellen$', 'Lernziele$', 'Inhaltsverzeichnis$', 'Auflistung$',
+    'Wichtig$', 'Tipp$', 'Bild$', 'Code$',
+)
+
+# Trennzeichen, ohne die ein Text kein mehrteiliger Listen-Inhalt sein kann
+_LIST_DELIM_RE = re.compile(r"[\n;•\-–]\s")
+
+# Eine gemeinsame Extractor-Instanz für alle Dateien (kompiliert die Tag-Regex nur einmal)
+_EXTRACTOR = WordExtraction()
+
+
+@lru_cache(maxsize=4096)
+def _parse_list_cached(text: str) -> tuple:
+    """
+    Parst einen einzelnen Listen-Text und cached das Ergebnis.
+    
+    Args:
+        text: Der zu parsende Listen-Text
+        
+    Returns:
+        Tuple der separaten Listenelemente (unveränderlich, da gecached)
+    """
+    return tuple(_EXTRACTOR._parse_list_content([text]))
+
+
+def parse_list_items(text: str) -> List[str]:
+    """
+    Teilt einen Listen-Text in Elemente auf, ohne den Parser für Texte ohne Trennzeichen aufzurufen.
+    
+    Args:
+        text: Der zu parsende Listen-Text
+        
+    Returns:
+        Liste der Listenelemente ([text], falls keine Trennzeichen vorhanden sind)
+    """
+    if not _LIST_DELIM_RE.search(text):
+        return [text]
+    return list(_parse_list_cached(text))
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Lädt eine JSON-Datei (mit orjson, falls verfügbar).
+    
+    Args:
+        path: Pfad zur JSON-Datei
+        
+    Returns:
+        Der geparste JSON-Inhalt
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(data: Any, path: str) -> None:
+    """
+    Schreibt Daten als eingerückte UTF-8 JSON-Datei (mit orjson, falls verfügbar).
+    
+    Die Daten werden vollständig serialisiert und mit einem einzigen write()
+    in eine temporäre Datei geschrieben, die anschließend atomar ersetzt wird.
+    
+    Args:
+        data: Die zu speichernden Daten
+        path: Zielpfad der JSON-Datei
+    """
+    if ORJSON_AVAILABLE:
+        buffer = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        buffer = (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buffer)
+    os.replace(tmp_path, path)
 
 
 def find_word_documents(root_path: str) -> List[str]:
@@ -24,20 +121,44 @@ def find_word_documents(root_path: str) -> List[str]:
     Returns:
         Liste der gefundenen .docx Dateipfade
     """
-    return glob.glob(os.path.join(root_path, "*.docx"))
+    with os.scandir(root_path) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith(".docx") and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def find_extracted_json_files(output_dir: str) -> List[str]:
+    """
+    Findet alle *_extracted_content.json Dateien im Ausgabeverzeichnis.
+    
+    Args:
+        output_dir: Ausgabeverzeichnis für JSON-Dateien
+        
+    Returns:
+        Liste der gefundenen JSON-Dateinamen
+    """
+    with os.scandir(output_dir) as entries:
+        return [
+            entry.name for entry in entries
+            if entry.name.endswith('_extracted_content.json') and entry.is_file(follow_symlinks=False)
+        ]
 
 
-def load_real_word_document(file_path: str) -> str:
+def load_real_word_document(file_path: str, filename: Optional[str] = None) -> str:
     """
     Lädt eine echte Word-Datei und extrahiert den Text.
     
     Args:
         file_path: Pfad zur Word-Datei
+        filename: Bereits ermittelter Dateiname (optional)
         
     Returns:
         Extrahierter Text als String
     """
-    print(f"📄 Lade echte Word-Datei: {os.path.basename(file_path)}")
+    if filename is None:
+        filename = os.path.basename(file_path)
+    print(f"📄 Lade echte Word-Datei: {filename}")
     
     if not os.path.exists(file_path):
         print(f"❌ Datei nicht gefunden: {file_path}")
@@ -47,19 +168,26 @@ def load_real_word_document(file_path: str) -> str:
     
     try:
         doc = Document(file_path)
-        paragraphs = doc.paragraphs
-        
-        print(f"✅ Word-Dokument geladen, {len(paragraphs)} Absätze gefunden")
+        # Absätze als Generator streamen statt doc.paragraphs als Liste aufzubauen
+        paragraphs = (block for block in doc.iter_inner_content() if isinstance(block, Paragraph))
         
-        # Zeige die ersten 10 Absätze für Debugging
-        for i, para in enumerate(paragraphs[:10]):
-            text = para.text.strip()
-            if text:
-                print(f"   Absatz {i+1}: {text[:50]}{'...' if len(text) > 50 else ''}")
-        
-        # Extrahiere den gesamten Text
-        full_text = '\n'.join([para.text for para in paragraphs if para.text.strip()])
+        print("✅ Word-Dokument geladen")
         
+        # Ein Durchlauf: Text sammeln und die ersten 10 Absätze für Debugging zeigen
+        paragraph_count = 0
+        texts = []
+        for i, para in enumerate(paragraphs):
+            paragraph_count += 1
+            text = para.text
+            stripped = text.strip()
+            if not stripped:
+                continue
+            texts.append(text)
+            if i < 10:
+                print(f"   Absatz {i+1}: {stripped[:50]}{'...' if len(stripped) > 50 else ''}")
+        full_text = '\n'.join(texts)
+
+        print(f"✅ {paragraph_count} Absätze gefunden")
         print(f"✅ Text erfolgreich extrahiert ({len(full_text)} Zeichen)")
         return full_text
         
@@ -77,10 +205,8 @@ def repair_existing_json_files(output_dir: str):
     """
     print("🔧 Repariere bestehende JSON-Dateien...")
     
-    extractor = WordExtraction()
-    
     # Finde alle JSON-Dateien
-    json_files = [f for f in os.listdir(output_dir) if f.endswith('_extracted_content.json')]
+    json_files = find_extracted_json_files(output_dir)
     
     for json_file in json_files:
         file_path = os.path.join(output_dir, json_file)
@@ -88,8 +214,7 @@ def repair_existing_json_files(output_dir: str):
         
         try:
             # Lade die JSON-Datei
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(file_path)
             
             # Durchlaufe alle Content-Blöcke
             for block in data.get('content', []):
@@ -98,7 +223,7 @@ def repair_existing_json_files(output_dir: str):
                     if 'items' in block and len(block['items']) == 1:
                         text = block['items'][0]
                         # Verwende die verbesserte Extraktionslogik
-                        items = extractor._parse_list_content([text])
+                        items = parse_list_items(text)
                         if len(items) > 1:
                             block['items'] = items
                             print(f"  ✅ Inhaltsverzeichnis repariert: {len(block['items'])} Items")
@@ -117,7 +242,7 @@ def repair_existing_json_files(output_dir: str):
                     # Repariere Lernziele falls nötig
                     if 'items' in block and len(block['items']) == 1:
                         text = block['items'][0]
-                        items = extractor._parse_list_content([text])
+                        items = parse_list_items(text)
                         if len(items) > 1:
                             block['items'] = items
                             print(f"  ✅ Lernziele repariert: {len(block['items'])} Items")
@@ -126,14 +251,13 @@ def repair_existing_json_files(output_dir: str):
                     # Repariere Auflistungen falls nötig
                     if 'items' in block and len(block['items']) == 1:
                         text = block['items'][0]
-                        items = extractor._parse_list_content([text])
+                        items = parse_list_items(text)
                         if len(items) > 1:
                             block['items'] = items
                             print(f"  ✅ Auflistung repariert: {len(block['items'])} Items")
             
             # Speichere die reparierte JSON-Datei
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            write_json_file(data, file_path)
             
             print(f"  💾 Reparierte JSON gespeichert: {file_path}")
             
@@ -141,15 +265,16 @@ def repair_existing_json_files(output_dir: str):
             print(f"❌ Fehler beim Reparieren von {json_file}: {e}")
     
     # Kopiere die reparierten JSON-Dateien in das Frontend /public/content/ Verzeichnis
-    copy_to_frontend(output_dir)
+    copy_to_frontend(output_dir, json_files)
 
 
-def copy_to_frontend(output_dir: str):
+def copy_to_frontend(output_dir: str, json_files: Optional[List[str]] = None):
     """
     Kopiert die reparierten JSON-Dateien in das Frontend /public/content/ Verzeichnis.
     
     Args:
         output_dir: Ausgabeverzeichnis für JSON-Dateien
+        json_files: Bereits ermittelte JSON-Dateinamen (optional, sonst wird output_dir gelesen)
     """
     print("📁 Kopiere JSON-Dateien in Frontend...")
     
@@ -159,18 +284,24 @@ def copy_to_frontend(output_dir: str):
     # Erstelle das Verzeichnis falls es nicht existiert
     os.makedirs(frontend_content_dir, exist_ok=True)
     
-    # Finde alle JSON-Dateien
-    json_files = [f for f in os.listdir(output_dir) if f.endswith('_extracted_content.json')]
+    # Finde alle JSON-Dateien (nur falls nicht bereits übergeben)
+    if json_files is None:
+        json_files = find_extracted_json_files(output_dir)
+    
+    # Bestehende Zieldateien einmalig erfassen (für den Unverändert-Check)
+    with os.scandir(frontend_content_dir) as entries:
+        existing_targets = {
+            entry.name: entry.stat() for entry in entries if entry.is_file(follow_symlinks=False)
+        }
     
     for json_file in json_files:
         source_path = os.path.join(output_dir, json_file)
         
         # Extrahiere die Kapitelnummer aus dem Dateinamen
         # z.B. "1.1 Installation und erste Schritte_extracted_content.json" -> "1.1"
-        if "1.1" in json_file:
-            target_filename = "1.1.json"
-        elif "1.2" in json_file:
-            target_filename = "1.2.json"
+        chapter_match = _CHAPTER_RE.search(json_file)
+        if chapter_match:
+            target_filename = f"{chapter_match.group(1)}.json"
         else:
             # Fallback: Verwende den ursprünglichen Namen
             target_filename = json_file.replace('_extracted_content.json', '.json')
@@ -178,9 +309,25 @@ def copy_to_frontend(output_dir: str):
         target_path = os.path.join(frontend_content_dir, target_filename)
         
         try:
-            # Kopiere die Datei
-            import shutil
-            shutil.copy2(source_path, target_path)
+            source_stat = os.stat(source_path)
+            target_stat = existing_targets.get(target_filename)
+            
+            # Überspringe unveränderte Dateien (Hardlink oder gleiche Größe und nicht älter)
+            if target_stat is not None and (
+                os.path.samestat(source_stat, target_stat)
+                or (target_stat.st_size == source_stat.st_size
+                    and target_stat.st_mtime >= source_stat.st_mtime)
+            ):
+                print(f"  ⏭️ Unverändert: {json_file} -> {target_filename}")
+                continue
+            
+            # Hardlink anlegen (kein Kopieren), sonst Zero-Copy-Fallback via copyfile
+            try:
+                if target_stat is not None:
+                    os.unlink(target_path)
+                os.link(source_path, target_path)
+            except OSError:
+                shutil.copyfile(source_path, target_path)
             print(f"  ✅ Kopiert: {json_file} -> {target_filename}")
         except Exception as e:
             print(f"  ❌ Fehler beim Kopieren von {json_file}: {e}")
@@ -235,45 +382,42 @@ def print_tag_analysis(analysis: dict, filename: str):
     
     # Alle verfügbaren Tags
     print("📋 ALLE VERFÜGBAREN TAGS:")
-    all_tags = ['Titel$', 'Titel2$', 'Titel3$', 'Text$', 'Hinweis$', 'Exkurs$', 
-                'Quellen$', 'Lernziele$', 'Inhaltsverzeichnis$', 'Auflistung$', 
-                'Wichtig$', 'Tipp$', 'Bild$', 'Code$']
-    
-    for tag in all_tags:
-        if tag in analysis["found_tags"]:
-            count = analysis["found_tags"][tag]
+    found_tags = analysis["found_tags"]
+    for tag in _ALL_TAGS:
+        count = found_tags.get(tag)
+        if count is not None:
             print(f"   ✅ {tag} ({count}x)")
         else:
             print(f"   ❌ {tag}")
 
 
-def process_single_word_file(file_path: str, output_dir: str) -> bool:
+def process_single_word_file(file_path: str, output_dir: str, filename: str, base_name: str) -> bool:
     """
     Verarbeitet eine einzelne Word-Datei und erstellt JSON-Ausgaben.
     
     Args:
         file_path: Pfad zur Word-Datei
         output_dir: Ausgabeverzeichnis für JSON-Dateien
+        filename: Dateiname der Word-Datei (vorberechnet in main)
+        base_name: Dateiname ohne Endung (vorberechnet in main)
         
     Returns:
         True wenn erfolgreich, False bei Fehler
     """
-    filename = os.path.basename(file_path)
-    base_name = os.path.splitext(filename)[0]
     
     print("=" * 60)
     print(f"🔄 VERARBEITE: {filename}")
     print("=" * 60)
     
     # Lade Word-Datei
-    text = load_real_word_document(file_path)
+    text = load_real_word_document(file_path, filename)
     if not text:
         print(f"❌ Konnte Text aus {filename} nicht extrahieren")
         return False
     
-    # Initialisiere WordExtraction Service
-    print("🔄 Initialisiere WordExtraction Service...")
-    extractor = WordExtraction()
+    # Gemeinsamen WordExtraction Service verwenden
+    print("🔄 Verwende WordExtraction Service...")
+    extractor = _EXTRACTOR
     
     # Führe JSON-Extraktion durch
     print("🔍 Führe JSON-Extraktion durch...")
@@ -297,15 +441,13 @@ def process_single_word_file(file_path: str, output_dir: str) -> bool:
     # Content JSON
     content_filename = f"{base_name}_extracted_content.json"
     content_path = os.path.join(output_dir, content_filename)
-    with open(content_path, 'w', encoding='utf-8') as f:
-        json.dump(json_content, f, ensure_ascii=False, indent=2)
+    write_json_file(json_content, content_path)
     print(f"💾 JSON gespeichert in: {content_path}")
     
     # Analysis JSON
     analysis_filename = f"{base_name}_tag_analysis.json"
     analysis_path = os.path.join(output_dir, analysis_filename)
-    with open(analysis_path, 'w', encoding='utf-8') as f:
-        json.dump(tag_analysis, f, ensure_ascii=False, indent=2)
+    write_json_file(tag_analysis, analysis_path)
     print(f"💾 JSON gespeichert in: {analysis_path}")
     
     # Zusammenfassung
@@ -342,6 +484,33 @@ def process_single_word_file(file_path: str, output_dir: str) -> bool:
     return True
 
 
+def process_word_file_worker(entry: Tuple[str, str, str], output_dir: str) -> Tuple[bool, List[str], str]:
+    """
+    Worker für den ProcessPoolExecutor: verarbeitet eine Word-Datei.
+    
+    Die Konsolenausgabe der Verarbeitung wird gepuffert und an den Hauptprozess
+    zurückgegeben, damit sie dort mit einem einzigen write() ausgegeben wird
+    und sich die Ausgaben paralleler Worker nicht vermischen.
+    
+    Args:
+        entry: Tupel aus (Dateipfad, Dateiname, Basisname)
+        output_dir: Ausgabeverzeichnis für JSON-Dateien
+        
+    Returns:
+        Tupel aus (Erfolg, Liste der erstellten JSON-Dateinamen, gepufferte Ausgabe)
+    """
+    file_path, filename, base_name = entry
+    output = io.StringIO()
+    with redirect_stdout(output):
+        success = process_single_word_file(file_path, output_dir, filename, base_name)
+    if not success:
+        return False, [], output.getvalue()
+    return True, [
+        f"{base_name}_extracted_content.json",
+        f"{base_name}_tag_analysis.json"
+    ], output.getvalue()
+
+
 def main():
     """
     Hauptfunktion zum Verarbeiten aller Word-Dateien.
@@ -364,25 +533,28 @@ def main():
         print("❌ Keine .docx Dateien gefunden!")
         return
     
-    print(f"📁 Gefundene .docx Dateien: {len(word_files)}")
-    for i, file_path in enumerate(word_files, 1):
+    # Dateiname und Basisname einmalig pro Datei berechnen
+    entries = []
+    for file_path in word_files:
         filename = os.path.basename(file_path)
+        entries.append((file_path, filename, os.path.splitext(filename)[0]))
+    
+    print(f"📁 Gefundene .docx Dateien: {len(word_files)}")
+    for i, (_, filename, _) in enumerate(entries, 1):
         print(f"   ✅ {i}. {filename}")
     print()
     
-    # Verarbeite jede Datei
+    # Verarbeite die Dateien parallel (jede Datei ist unabhängig)
     successful_files = 0
     created_files = []
     
-    for file_path in word_files:
-        if process_single_word_file(file_path, output_dir):
-            successful_files += 1
-            filename = os.path.basename(file_path)
-            base_name = os.path.splitext(filename)[0]
-            created_files.extend([
-                f"{base_name}_extracted_content.json",
-                f"{base_name}_tag_analysis.json"
-            ])
+    worker = partial(process_word_file_worker, output_dir=output_dir)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for success, files, output in executor.map(worker, entries):
+            sys.stdout.write(output)
+            if success:
+                successful_files += 1
+                created_files.extend(files)
     
     # Falls keine Word-Dateien verarbeitet werden konnten, repariere bestehende JSON-Dateien
     if successful_files == 0: